@@ -4,6 +4,7 @@
 -- ============================================================
 
 -- Drop tables if they exist (for clean rebuild)
+DROP TABLE IF EXISTS audit_trace;
 DROP TABLE IF EXISTS execution_audit;
 DROP TABLE IF EXISTS access_policy;
 DROP TABLE IF EXISTS physical_mapping;
@@ -250,7 +251,6 @@ CREATE TABLE execution_audit (
 
     -- Execution details
     final_sql TEXT,
-    decision_trace TEXT NOT NULL,  -- JSON: complete decision path
     request_params TEXT,           -- JSON: original request parameters
     execution_context TEXT,        -- JSON: execution context snapshot
     user_id INTEGER,
@@ -268,6 +268,18 @@ CREATE TABLE execution_audit (
     FOREIGN KEY (physical_mapping_id) REFERENCES physical_mapping(id)
 );
 
+-- ============================================================
+-- 6️⃣b AUDIT_TRACE
+-- Decision trace blobs split out of the main audit row
+-- Traces are large and rarely read, so history scans skip them
+-- ============================================================
+CREATE TABLE audit_trace (
+    audit_id TEXT PRIMARY KEY,     -- Matches execution_audit.audit_id
+    trace_json TEXT NOT NULL,      -- JSON: complete decision path
+
+    FOREIGN KEY (audit_id) REFERENCES execution_audit(audit_id)
+);
+
 -- ============================================================
 -- MOCK PHYSICAL DATA
 -- Fact table for production records
@@ -328,6 +340,14 @@ CREATE INDEX idx_execution_audit_id ON execution_audit(audit_id);
 CREATE INDEX idx_execution_audit_user ON execution_audit(user_id);
 CREATE INDEX idx_execution_audit_date ON execution_audit(executed_at);
 
+-- Indexes matching hot WHERE clauses so lookups seek instead of scanning
+CREATE INDEX idx_term_dict_status ON term_dictionary(status);
+CREATE INDEX idx_metric_dep_down ON metric_dependency(downstream_metric_id, downstream_version_id);
+CREATE INDEX idx_semver_object ON semantic_version(semantic_object_id, effective_from DESC);
+CREATE INDEX idx_physmap_logical ON physical_mapping(logical_definition_id, priority DESC);
+CREATE INDEX idx_access_policy_lookup ON access_policy(semantic_object_id, role, action, priority DESC);
+CREATE INDEX idx_audit_user_time ON execution_audit(user_id, executed_at DESC);
+
 -- ============================================================
 -- FACT PRODUCTION RECORDS INDEXES
 -- ============================================================
@@ -9,6 +9,7 @@ from .dependency_builder import DependencyBuilder
 from .grain_validator import GrainValidator
 from .models import (
     SemanticObject,
+    SemanticObjectIndex,
     OntologyEntity,
     OntologyDimension,
     OntologyAttribute,
@@ -36,6 +37,7 @@ __all__ = [
     "DependencyBuilder",
     "GrainValidator",
     "SemanticObject",
+    "SemanticObjectIndex",
     "OntologyEntity",
     "OntologyDimension",
     "OntologyAttribute",
@@ -10,6 +10,10 @@ from typing import Optional
 class OrchestratorConfig:
     db_path: str
     default_engine_type: str = "sqlite"
+    # Persist decision traces in the column-oriented compact form instead
+    # of one dict per step. Saves audit bytes at high query rates; off by
+    # default because the expanded form is easier to inspect by hand.
+    compact_trace: bool = False
 
     @property
     def metadata_db_path(self) -> str:
@@ -5,6 +5,7 @@ Handles physical SQL execution and result processing.
 Responsible for rendering SQL templates and executing against data sources.
 """
 
+import functools
 import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime
@@ -16,6 +17,12 @@ from .sqlite_stores import SQLiteMetadataStore, SQLiteQueryExecutor
 
 logger = logging.getLogger(__name__)
 
+# Compiled Jinja2 templates keyed by template text: recurring metrics
+# re-render the same mapping every request, so only the first call pays
+# the lex/parse cost. Keying on the text itself means an edited mapping
+# misses naturally, with no explicit invalidation hook.
+_compile_template = functools.lru_cache(maxsize=512)(Template)
+
 
 class ExecutionResult:
     """Container for execution results"""
@@ -160,9 +167,9 @@ class ExecutionEngine:
                     f"Required schema: {mapping.params_schema}"
                 )
 
-        # Render SQL template
+        # Render SQL template (compiled form is cached across calls)
         try:
-            template = Template(mapping.sql_template)
+            template = _compile_template(mapping.sql_template)
             rendered_sql = template.render(**parameters)
 
             # Clean up extra whitespace for logging
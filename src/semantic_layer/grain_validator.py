@@ -2,26 +2,77 @@
 Grain validation for metrics based on metric_entity_map.
 """
 
-from typing import Dict, Any, List
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
 
 from .interfaces import MetadataStore
 
+# Cached per-metric constraint entry: (allowed, forbidden, allowed_sorted)
+_GrainEntry = Tuple[frozenset, frozenset, Tuple[str, ...]]
+
 
 class GrainValidator:
     def __init__(self, metadata_store: MetadataStore):
         self.metadata_store = metadata_store
+        self._constraints_cache: Dict[int, Optional[_GrainEntry]] = {}
+        # Verdict memo keyed by the value-relevant inputs: the check only
+        # depends on the requested dimensions/grain, not on other
+        # parameter values, so repeats collapse to a dict lookup.
+        self._verdict_cache: 'OrderedDict[tuple, Dict[str, Any]]' = OrderedDict()
+        self._verdict_cache_max = 512
+
+    def _get_constraints(self, metric_id: int) -> Optional[_GrainEntry]:
+        """Fetch and cache grain constraints (including the pre-sorted
+        allowed list used by failure suggestions) for a metric."""
+        if metric_id in self._constraints_cache:
+            return self._constraints_cache[metric_id]
+
+        maps = [m for m in self.metadata_store.list_metric_entity_maps() if m.metric_id == metric_id]
+        if not maps:
+            entry = None
+        else:
+            mapping = maps[0]
+            allowed = frozenset(mapping.allowed_dimensions or [])
+            forbidden = frozenset(mapping.forbidden_dimensions or [])
+            entry = (allowed, forbidden, tuple(sorted(allowed)))
+        self._constraints_cache[metric_id] = entry
+        return entry
+
+    def invalidate(self) -> None:
+        """Drop cached constraints and verdicts after metadata changes."""
+        self._constraints_cache.clear()
+        self._verdict_cache.clear()
 
     def validate(self, metric_id: int, parameters: Dict[str, Any], metric_grain: str) -> Dict[str, Any]:
         requested_dimensions = self._get_requested_dimensions(parameters)
         requested_grain = parameters.get("grain")
 
-        maps = [m for m in self.metadata_store.list_metric_entity_maps() if m.metric_id == metric_id]
-        if not maps:
+        cache_key = (metric_id, tuple(requested_dimensions), requested_grain, metric_grain)
+        cached = self._verdict_cache.get(cache_key)
+        if cached is not None:
+            self._verdict_cache.move_to_end(cache_key)
+            return cached
+
+        verdict = self._validate_uncached(
+            metric_id, requested_dimensions, requested_grain, metric_grain
+        )
+        self._verdict_cache[cache_key] = verdict
+        if len(self._verdict_cache) > self._verdict_cache_max:
+            self._verdict_cache.popitem(last=False)
+        return verdict
+
+    def _validate_uncached(
+        self,
+        metric_id: int,
+        requested_dimensions: List[str],
+        requested_grain: Optional[str],
+        metric_grain: str
+    ) -> Dict[str, Any]:
+        entry = self._get_constraints(metric_id)
+        if entry is None:
             return {"status": "WARN", "reason": "No metric_entity_map defined", "action": "SUGGEST"}
 
-        mapping = maps[0]
-        allowed = set(mapping.allowed_dimensions or [])
-        forbidden = set(mapping.forbidden_dimensions or [])
+        allowed, forbidden, allowed_sorted = entry
 
         if requested_dimensions:
             if allowed and not set(requested_dimensions).issubset(allowed):
@@ -30,7 +81,7 @@ class GrainValidator:
                     "reason": f"Requested dimensions not allowed: {requested_dimensions}",
                     "action": "REFUSE",
                     "suggestions": {
-                        "allowed_dimensions": sorted(list(allowed))
+                        "allowed_dimensions": list(allowed_sorted)
                     }
                 }
             if set(requested_dimensions) & forbidden:
@@ -39,7 +90,7 @@ class GrainValidator:
                     "reason": f"Requested dimensions forbidden: {requested_dimensions}",
                     "action": "REFUSE",
                     "suggestions": {
-                        "allowed_dimensions": sorted(list(allowed))
+                        "allowed_dimensions": list(allowed_sorted)
                     }
                 }
 
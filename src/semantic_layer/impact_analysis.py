@@ -13,102 +13,97 @@ Node = Tuple[str, int]  # (type, id)
 class ImpactAnalyzer:
     def __init__(self, metadata_store: MetadataStore):
         self.metadata_store = metadata_store
+        # Reachability cache: valid only for a single graph fingerprint.
+        self._graph_fingerprint: Optional[int] = None
+        self._reverse_edges: Dict[Node, Set[Node]] = {}
+        self._reach_cache: Dict[Node, Dict[str, List[int]]] = {}
 
     def build_dependency_graph(self) -> Dict[Node, Set[Node]]:
         edges: Dict[Node, Set[Node]] = {}
 
-        def add_edge(src: Node, dst: Node) -> None:
-            if src not in edges:
-                edges[src] = set()
-            edges[src].add(dst)
-
-        # Metric -> Entity/Dimension/Attribute/Mapping
-        metric_entity_maps = self.metadata_store.list_metric_entity_maps()
-        for mem in metric_entity_maps:
-            metric_node = ("metric", mem.metric_id)
-            entity_node = ("entity", mem.entity_id)
-            add_edge(metric_node, entity_node)
-
-            dims = self.metadata_store.list_dimensions_by_entity(mem.entity_id)
-            attrs = self.metadata_store.list_attributes_by_entity(mem.entity_id)
-
-            allowed_dim_names = set(mem.allowed_dimensions or [])
-            for dim in dims:
-                if not allowed_dim_names or dim.name in allowed_dim_names:
-                    add_edge(metric_node, ("dimension", dim.id))
-
-            for attr in attrs:
-                add_edge(metric_node, ("attribute", attr.id))
-
-        # Metric -> Mapping (via versions and logical definitions)
-        for metric in self.metadata_store.list_active_semantic_objects():
-            versions = self.metadata_store.get_versions_for_object(metric.id)
-            for version in versions:
-                logical_def = self.metadata_store.get_logical_definition(version.id)
-                if not logical_def:
-                    continue
-                mappings = self.metadata_store.get_physical_mappings(logical_def.id)
-                for mapping in mappings:
-                    add_edge(("metric", metric.id), ("mapping", mapping.id))
+        def add_edges(pairs, src_type: str, dst_type: str) -> None:
+            for src_id, dst_id in pairs:
+                src = (src_type, src_id)
+                if src not in edges:
+                    edges[src] = set()
+                edges[src].add((dst_type, dst_id))
 
+        # One snapshot fetch instead of per-entity / per-version fan-out.
+        snapshot = self.metadata_store.fetch_graph_snapshot()
+
+        add_edges(snapshot.metric_entity_edges, "metric", "entity")
+        add_edges(snapshot.metric_dimension_edges, "metric", "dimension")
+        add_edges(snapshot.metric_attribute_edges, "metric", "attribute")
+        add_edges(snapshot.metric_mapping_edges, "metric", "mapping")
         # Metric dependencies (downstream depends on upstream)
-        for dep in self.metadata_store.list_metric_dependencies():
-            downstream_node = ("metric_version", dep.downstream_version_id or dep.downstream_metric_id)
-            upstream_node = ("metric_version", dep.upstream_version_id or dep.upstream_metric_id)
-            add_edge(downstream_node, upstream_node)
-            add_edge(("metric", dep.downstream_metric_id), ("metric", dep.upstream_metric_id))
+        add_edges(snapshot.version_dependency_edges, "metric_version", "metric_version")
+        add_edges(snapshot.metric_dependency_edges, "metric", "metric")
 
         return edges
 
     def impact(self, target_type: str, target_id: int) -> Dict[str, Any]:
         edges = self.build_dependency_graph()
-        reverse_edges: Dict[Node, Set[Node]] = {}
 
-        for src, dsts in edges.items():
-            for dst in dsts:
-                reverse_edges.setdefault(dst, set()).add(src)
+        # Reuse reverse edges and per-target reachability while the graph
+        # is unchanged; any metadata edit changes the fingerprint and
+        # invalidates both.
+        fingerprint = hash(frozenset(
+            (src, dst) for src, dsts in edges.items() for dst in dsts
+        ))
+        if fingerprint != self._graph_fingerprint:
+            reverse_edges: Dict[Node, Set[Node]] = {}
+            for src, dsts in edges.items():
+                for dst in dsts:
+                    reverse_edges.setdefault(dst, set()).add(src)
+            self._graph_fingerprint = fingerprint
+            self._reverse_edges = reverse_edges
+            self._reach_cache = {}
 
         start = (target_type, target_id)
+        buckets = self._reach_cache.get(start)
+        if buckets is None:
+            buckets = self._collect_upstream(start)
+            self._reach_cache[start] = buckets
+
+        return {
+            "target": {"type": target_type, "id": target_id},
+            "impacted_metrics": sorted(buckets.get("metric", [])),
+            "impacted_mappings": sorted(buckets.get("mapping", [])),
+            "impacted_entities": sorted(buckets.get("entity", [])),
+            "impacted_dimensions": sorted(buckets.get("dimension", [])),
+            "impacted_attributes": sorted(buckets.get("attribute", []))
+        }
+
+    def _collect_upstream(self, start: Node) -> Dict[str, List[int]]:
+        """Walk reverse edges from start, bucketing impacted ids by node type."""
         visited: Set[Node] = set()
         stack: List[Node] = [start]
+        # Accumulate impacted ids per node type during traversal so the
+        # report does not need a separate filtering pass per type.
+        buckets: Dict[str, List[int]] = {}
 
         while stack:
             node = stack.pop()
             if node in visited:
                 continue
             visited.add(node)
-            for parent in reverse_edges.get(node, set()):
+            buckets.setdefault(node[0], []).append(node[1])
+            for parent in self._reverse_edges.get(node, set()):
                 if parent not in visited:
                     stack.append(parent)
 
-        impacted_metrics = sorted({n[1] for n in visited if n[0] == "metric"})
-        impacted_mappings = sorted({n[1] for n in visited if n[0] == "mapping"})
-        impacted_entities = sorted({n[1] for n in visited if n[0] == "entity"})
-        impacted_dimensions = sorted({n[1] for n in visited if n[0] == "dimension"})
-        impacted_attributes = sorted({n[1] for n in visited if n[0] == "attribute"})
-
-        return {
-            "target": {"type": target_type, "id": target_id},
-            "impacted_metrics": impacted_metrics,
-            "impacted_mappings": impacted_mappings,
-            "impacted_entities": impacted_entities,
-            "impacted_dimensions": impacted_dimensions,
-            "impacted_attributes": impacted_attributes
-        }
+        return buckets
 
     def diff(self, metric_name: str, version_a: str, version_b: str) -> Dict[str, Any]:
         metric = self.metadata_store.get_semantic_object_by_name(metric_name)
         if not metric:
             raise ValueError(f"Metric not found: {metric_name}")
 
-        versions = self.metadata_store.get_versions_for_object(metric.id)
-        version_map = {v.version_name: v for v in versions}
-        if version_a not in version_map or version_b not in version_map:
+        v_a = self.metadata_store.get_version_by_name(metric.id, version_a)
+        v_b = self.metadata_store.get_version_by_name(metric.id, version_b)
+        if not v_a or not v_b:
             raise ValueError("Version not found for metric")
 
-        v_a = version_map[version_a]
-        v_b = version_map[version_b]
-
         logical_a = self.metadata_store.get_logical_definition(v_a.id)
         logical_b = self.metadata_store.get_logical_definition(v_b.id)
 
@@ -169,12 +164,10 @@ class ImpactAnalyzer:
         impact = self.impact("metric", metric.id)
         risk = diff.get("risk", "L1")
 
-        versions = self.metadata_store.get_versions_for_object(metric.id)
-        version_map = {v.version_name: v for v in versions}
-        if version_a not in version_map or version_b not in version_map:
+        v_a = self.metadata_store.get_version_by_name(metric.id, version_a)
+        v_b = self.metadata_store.get_version_by_name(metric.id, version_b)
+        if not v_a or not v_b:
             raise ValueError("Version not found for metric")
-        v_a = version_map[version_a]
-        v_b = version_map[version_b]
 
         report = {
             "summary": {
@@ -2,7 +2,7 @@
 Minimal interfaces for storage and execution abstractions.
 """
 
-from typing import Protocol, Optional, List, Dict, Any
+from typing import Protocol, Optional, List, Dict, Any, Tuple
 
 from .models import (
     SemanticObject,
@@ -19,6 +19,7 @@ from .models import (
     MetricEntityMap,
     MetricDependency,
     TermDictionary,
+    GraphSnapshot,
 )
 
 
@@ -26,15 +27,28 @@ class MetadataStore(Protocol):
     def list_active_semantic_objects(self) -> List[SemanticObject]:
         ...
 
+    def get_objects_version(self) -> Any:
+        ...
+
     def get_semantic_object_by_name(self, name: str) -> Optional[SemanticObject]:
         ...
 
     def get_semantic_object_by_id(self, obj_id: int) -> Optional[SemanticObject]:
         ...
 
+    def get_versions_with_logic(self, semantic_object_id: int) -> List[tuple]:
+        ...
+
     def get_versions_for_object(self, semantic_object_id: int) -> List[SemanticVersion]:
         ...
 
+    def get_version_by_name(
+        self,
+        semantic_object_id: int,
+        version_name: str
+    ) -> Optional[SemanticVersion]:
+        ...
+
     def get_logical_definition(self, semantic_version_id: int) -> Optional[LogicalDefinition]:
         ...
 
@@ -51,6 +65,12 @@ class MetadataStore(Protocol):
     def list_dimensions_by_entity(self, entity_id: int) -> List[OntologyDimension]:
         ...
 
+    def list_all_dimensions_grouped(self) -> Dict[int, List[OntologyDimension]]:
+        ...
+
+    def list_all_attributes_grouped(self) -> Dict[int, List[OntologyAttribute]]:
+        ...
+
     def list_attributes_by_entity(self, entity_id: int) -> List[OntologyAttribute]:
         ...
 
@@ -66,6 +86,9 @@ class MetadataStore(Protocol):
     def find_terms_in_text(self, text: str) -> List[TermDictionary]:
         ...
 
+    def fetch_graph_snapshot(self) -> GraphSnapshot:
+        ...
+
     def replace_metric_dependencies_for_version(
         self,
         downstream_metric_id: int,
@@ -81,7 +104,7 @@ class PolicyStore(Protocol):
         semantic_object_id: int,
         role: str,
         action: str
-    ) -> List[AccessPolicy]:
+    ) -> Tuple[AccessPolicy, ...]:
         ...
 
     def get_user_policies(self, role: str) -> List[Dict[str, Any]]:
@@ -98,11 +121,17 @@ class PolicyStore(Protocol):
     ) -> int:
         ...
 
+    def create_policies_bulk(self, policies: List[Dict[str, Any]]) -> int:
+        ...
+
 
 class AuditStore(Protocol):
     def save_audit(self, audit: ExecutionAudit) -> None:
         ...
 
+    def save_audit_batch(self, audits: List[ExecutionAudit]) -> None:
+        ...
+
     def save_denied(
         self,
         audit_id: str,
@@ -117,10 +146,14 @@ class AuditStore(Protocol):
     def load_audit(self, audit_id: str) -> Optional[ExecutionAudit]:
         ...
 
+    def get_audit_trace(self, audit_id: str) -> Optional[Dict[str, Any]]:
+        ...
+
     def list_audit_history(
         self,
         limit: int = 50,
-        user_id: Optional[int] = None
+        user_id: Optional[int] = None,
+        before_executed_at: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         ...
 
@@ -5,13 +5,143 @@ Defines the structure for all metadata entities in the semantic layer.
 All models are decoupled from physical implementation details.
 """
 
-from dataclasses import dataclass, field
-from typing import Optional, Dict, Any, List
+import functools
+import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field, InitVar
+from typing import Optional, Dict, Any, List, NamedTuple
 from datetime import datetime
-import json
 
+# JSON column decoding prefers the fastest available C decoder; both
+# accelerators are optional and stdlib json remains the fallback.
+try:
+    from msgspec.json import decode as _json_loads
+except ImportError:
+    try:
+        from orjson import loads as _json_loads
+    except ImportError:
+        from json import loads as _json_loads
 
-@dataclass
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+# orjson.Fragment (>= 3.7) lets pre-encoded JSON bytes be written
+# verbatim during dumps; older orjson falls back to the re-parse path.
+_json_fragment = getattr(_orjson, 'Fragment', None) if _orjson else None
+
+
+if _orjson is not None:
+    def json_dumps(obj: Any) -> str:
+        """Compact JSON encode using the C-accelerated encoder."""
+        return _orjson.dumps(obj, default=str).decode()
+else:
+    import json as _json
+
+    def json_dumps(obj: Any) -> str:
+        """Compact JSON encode (stdlib fallback)."""
+        return _json.dumps(obj, separators=(',', ':'), default=str)
+
+
+# Sentinel distinguishing "key absent" from a stored None value
+_MISS = object()
+
+
+def _loads_list(s) -> list:
+    """Decode a JSON array column, short-circuiting empty literals."""
+    return [] if not s or s == '[]' else _json_loads(s)
+
+
+def _loads_dict(s) -> dict:
+    """Decode a JSON object column, short-circuiting empty literals."""
+    return {} if not s or s == '{}' else _json_loads(s)
+
+
+def _parse_db_ts(s: str) -> datetime:
+    """
+    Parse the DB's fixed 'YYYY-MM-DD HH:MM:SS[.ffffff]' timestamp layout.
+
+    datetime.fromisoformat handles the full ISO grammar (offsets,
+    date-only forms, ...); slicing the known positions directly is
+    noticeably faster for the uniform strings SQLite actually stores.
+    Anything that doesn't fit the layout falls back to the full parser.
+    """
+    try:
+        if len(s) == 19:
+            return datetime(
+                int(s[0:4]), int(s[5:7]), int(s[8:10]),
+                int(s[11:13]), int(s[14:16]), int(s[17:19])
+            )
+        if len(s) > 20 and s[19] == '.':
+            return datetime(
+                int(s[0:4]), int(s[5:7]), int(s[8:10]),
+                int(s[11:13]), int(s[14:16]), int(s[17:19]),
+                int(s[20:26].ljust(6, '0'))
+            )
+    except ValueError:
+        pass
+    return datetime.fromisoformat(s)
+
+
+# Timestamps from related rows cluster heavily (audit batches, versions
+# created in one migration), so parsing is memoized; datetimes are
+# immutable and safe to share.
+_parse_dt = functools.lru_cache(maxsize=4096)(_parse_db_ts)
+
+
+def _compile_from_db_row(cls, schema):
+    """
+    Compile a specialized row parser for a model class.
+
+    schema is a list of (field_name, coercion) pairs in row/column order;
+    coercion is one of 'raw', 'json_dict', 'json_list', 'json_opt',
+    'datetime', 'bool'. The generated function inlines the tuple unpack
+    and per-column coercions into straight-line code, avoiding per-row
+    global lookups in bulk hydration loops.
+    """
+    names = [f"v{i}" for i in range(len(schema))]
+    exprs = []
+    for name, (_field_name, coercion) in zip(names, schema):
+        if coercion == "raw":
+            exprs.append(name)
+        elif coercion == "json_dict":
+            exprs.append(f"_loads_dict({name})")
+        elif coercion == "json_list":
+            exprs.append(f"_loads_list({name})")
+        elif coercion == "json_opt":
+            exprs.append(f"_loads({name}) if {name} else None")
+        elif coercion == "datetime":
+            exprs.append(f"_dt({name}) if {name} else None")
+        elif coercion == "bool":
+            exprs.append(f"bool({name})")
+        elif coercion == "intern":
+            exprs.append(f"_intern({name})")
+        elif coercion == "intern_opt":
+            exprs.append(f"_intern({name}) if {name} else None")
+        else:
+            raise ValueError(f"Unknown coercion: {coercion}")
+
+    source = (
+        "def from_db_row(row):\n"
+        "    \"\"\"Create instance from database row\"\"\"\n"
+        f"    {', '.join(names)} = row\n"
+        f"    return _cls({', '.join(exprs)})\n"
+    )
+    namespace = {
+        "_cls": cls,
+        "_loads": _json_loads,
+        "_loads_list": _loads_list,
+        "_loads_dict": _loads_dict,
+        "_dt": _parse_dt,
+        "_intern": sys.intern,
+    }
+    exec(source, namespace)
+    return staticmethod(namespace["from_db_row"])
+
+
+@dataclass(slots=True, eq=False)
 class SemanticObject:
     """
     Represents a business concept/metric in the semantic layer.
@@ -25,6 +155,20 @@ class SemanticObject:
     status: str = 'active'
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
+    # Lowercased forms, precomputed once so relevance scoring and alias
+    # matching never re-lowercase per (keyword, object) pair.
+    _alias_set: frozenset = field(init=False, repr=False, compare=False)
+    _name_lower: str = field(init=False, repr=False, compare=False)
+    _desc_lower: str = field(init=False, repr=False, compare=False)
+    _aliases_lower: tuple = field(init=False, repr=False, compare=False)
+    _aliases_set: frozenset = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._name_lower = self.name.lower()
+        self._desc_lower = self.description.lower()
+        self._aliases_lower = tuple(alias.lower() for alias in self.aliases)
+        self._aliases_set = frozenset(self._aliases_lower)
+        self._alias_set = self._aliases_set | {self._name_lower}
 
     @classmethod
     def from_db_row(cls, row: tuple) -> 'SemanticObject':
@@ -34,25 +178,36 @@ class SemanticObject:
             id=id,
             name=name,
             description=description,
-            aliases=json.loads(aliases_json) if aliases_json else [],
-            domain=domain,
-            status=status,
-            created_at=datetime.fromisoformat(created_at) if created_at else None,
-            updated_at=datetime.fromisoformat(updated_at) if updated_at else None
+            aliases=_loads_list(aliases_json),
+            domain=sys.intern(domain),
+            status=sys.intern(status),
+            created_at=_parse_dt(created_at) if created_at else None,
+            updated_at=_parse_dt(updated_at) if updated_at else None
         )
 
+    @classmethod
+    def from_db_rows(cls, rows) -> List['SemanticObject']:
+        """Create instances from many database rows at once"""
+        from_row = cls.from_db_row
+        return [from_row(row) for row in rows]
+
     def matches_alias(self, term: str) -> bool:
         """Check if term matches name or any alias"""
-        term_lower = term.lower()
-        if term_lower == self.name.lower():
-            return True
-        return any(term_lower == alias.lower() for alias in self.aliases)
+        return term.lower() in self._alias_set
+
+    def __eq__(self, other) -> bool:
+        # DB-identity semantics: two objects are equal iff they refer to
+        # the same stored row, regardless of hydrated field contents.
+        return type(self) is type(other) and self.id == other.id
+
+    def __hash__(self) -> int:
+        return hash((type(self).__name__, self.id))
 
     def __repr__(self) -> str:
         return f"SemanticObject(id={self.id}, name='{self.name}', domain='{self.domain}')"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False)
 class OntologyEntity:
     """
     Represents an ontology entity (core business object).
@@ -71,14 +226,19 @@ class OntologyEntity:
             id=id,
             name=name,
             description=description,
-            domain=domain,
-            status=status,
-            created_at=datetime.fromisoformat(created_at) if created_at else None
+            domain=sys.intern(domain),
+            status=sys.intern(status),
+            created_at=_parse_dt(created_at) if created_at else None
         )
 
+    @classmethod
+    def from_db_rows(cls, rows) -> List['OntologyEntity']:
+        """Create instances from many database rows at once"""
+        from_row = cls.from_db_row
+        return [from_row(row) for row in rows]
+
 
-@dataclass
-class OntologyDimension:
+class OntologyDimension(NamedTuple):
     """
     Represents a dimension attached to an entity.
     """
@@ -98,14 +258,19 @@ class OntologyDimension:
             entity_id=entity_id,
             name=name,
             description=description,
-            data_type=data_type,
-            status=status,
-            created_at=datetime.fromisoformat(created_at) if created_at else None
+            data_type=sys.intern(data_type),
+            status=sys.intern(status),
+            created_at=_parse_dt(created_at) if created_at else None
         )
 
+    @classmethod
+    def from_db_rows(cls, rows) -> List['OntologyDimension']:
+        """Create instances from many database rows at once"""
+        from_row = cls.from_db_row
+        return [from_row(row) for row in rows]
 
-@dataclass
-class OntologyAttribute:
+
+class OntologyAttribute(NamedTuple):
     """
     Represents an attribute attached to an entity.
     """
@@ -126,15 +291,20 @@ class OntologyAttribute:
             entity_id=entity_id,
             name=name,
             description=description,
-            data_type=data_type,
+            data_type=sys.intern(data_type),
             is_key=bool(is_key),
-            status=status,
-            created_at=datetime.fromisoformat(created_at) if created_at else None
+            status=sys.intern(status),
+            created_at=_parse_dt(created_at) if created_at else None
         )
 
+    @classmethod
+    def from_db_rows(cls, rows) -> List['OntologyAttribute']:
+        """Create instances from many database rows at once"""
+        from_row = cls.from_db_row
+        return [from_row(row) for row in rows]
+
 
-@dataclass
-class OntologyRelationship:
+class OntologyRelationship(NamedTuple):
     """
     Represents a relationship between entities.
     """
@@ -155,16 +325,21 @@ class OntologyRelationship:
             id=id,
             from_entity_id=from_entity_id,
             to_entity_id=to_entity_id,
-            relationship_type=relationship_type,
+            relationship_type=sys.intern(relationship_type),
             description=description,
-            cardinality=cardinality,
-            status=status,
-            created_at=datetime.fromisoformat(created_at) if created_at else None
+            cardinality=sys.intern(cardinality) if cardinality else None,
+            status=sys.intern(status),
+            created_at=_parse_dt(created_at) if created_at else None
         )
 
+    @classmethod
+    def from_db_rows(cls, rows) -> List['OntologyRelationship']:
+        """Create instances from many database rows at once"""
+        from_row = cls.from_db_row
+        return [from_row(row) for row in rows]
+
 
-@dataclass
-class MetricEntityMap:
+class MetricEntityMap(NamedTuple):
     """
     Explicit mapping between metric and entity, with grain constraints.
     """
@@ -187,15 +362,20 @@ class MetricEntityMap:
             metric_id=metric_id,
             entity_id=entity_id,
             grain_level=grain_level,
-            allowed_dimensions=json.loads(allowed_dimensions_json) if allowed_dimensions_json else [],
-            forbidden_dimensions=json.loads(forbidden_dimensions_json) if forbidden_dimensions_json else [],
+            allowed_dimensions=_loads_list(allowed_dimensions_json),
+            forbidden_dimensions=_loads_list(forbidden_dimensions_json),
             join_path_policy=join_path_policy,
-            created_at=datetime.fromisoformat(created_at) if created_at else None
+            created_at=_parse_dt(created_at) if created_at else None
         )
 
+    @classmethod
+    def from_db_rows(cls, rows) -> List['MetricEntityMap']:
+        """Create instances from many database rows at once"""
+        from_row = cls.from_db_row
+        return [from_row(row) for row in rows]
+
 
-@dataclass
-class MetricDependency:
+class MetricDependency(NamedTuple):
     """
     Metric-to-metric dependency edge.
     """
@@ -219,14 +399,19 @@ class MetricDependency:
             downstream_metric_id=downstream_metric_id,
             upstream_version_id=upstream_version_id,
             downstream_version_id=downstream_version_id,
-            dependency_type=dependency_type,
+            dependency_type=sys.intern(dependency_type),
             description=description,
-            created_at=datetime.fromisoformat(created_at) if created_at else None
+            created_at=_parse_dt(created_at) if created_at else None
         )
 
+    @classmethod
+    def from_db_rows(cls, rows) -> List['MetricDependency']:
+        """Create instances from many database rows at once"""
+        from_row = cls.from_db_row
+        return [from_row(row) for row in rows]
+
 
-@dataclass
-class TermDictionary:
+class TermDictionary(NamedTuple):
     """
     Lightweight term dictionary for normalization.
     """
@@ -249,13 +434,19 @@ class TermDictionary:
             normalized_term=normalized_term,
             object_type=object_type,
             object_id=object_id,
-            language=language,
-            status=status,
-            created_at=datetime.fromisoformat(created_at) if created_at else None
+            language=sys.intern(language),
+            status=sys.intern(status),
+            created_at=_parse_dt(created_at) if created_at else None
         )
 
+    @classmethod
+    def from_db_rows(cls, rows) -> List['TermDictionary']:
+        """Create instances from many database rows at once"""
+        from_row = cls.from_db_row
+        return [from_row(row) for row in rows]
+
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class SemanticVersion:
     """
     Represents a version of a semantic object's definition.
@@ -271,6 +462,28 @@ class SemanticVersion:
     priority: int = 0  # For conflict resolution: higher priority wins when scores are equal
     description: Optional[str] = None
     created_at: Optional[datetime] = None
+    _cond_items: Optional[Any] = field(init=False, repr=False, compare=False)
+    # Last-input memos: repeated checks with the same timestamp/scenario
+    # (batched resolutions, plan-cache misses for the same query shape)
+    # reuse the previous answer.
+    _last_effective: Optional[tuple] = field(init=False, repr=False, compare=False)
+    _last_scenario: Optional[tuple] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Pre-normalize the scenario condition so matches_scenario is a
+        # single subset check instead of a per-call key loop. Conditions
+        # with list/dict values are not hashable; those keep plain item
+        # tuples and fall back to per-key equality.
+        if self.scenario_condition:
+            items = tuple(self.scenario_condition.items())
+            try:
+                self._cond_items = frozenset(items)
+            except TypeError:
+                self._cond_items = items
+        else:
+            self._cond_items = None
+        self._last_effective = None
+        self._last_scenario = None
 
     @classmethod
     def from_db_row(cls, row: tuple) -> 'SemanticVersion':
@@ -281,30 +494,42 @@ class SemanticVersion:
             id=id,
             semantic_object_id=semantic_object_id,
             version_name=version_name,
-            effective_from=datetime.fromisoformat(effective_from),
-            effective_to=datetime.fromisoformat(effective_to) if effective_to else None,
-            scenario_condition=json.loads(scenario_json) if scenario_json else None,
+            effective_from=_parse_dt(effective_from),
+            effective_to=_parse_dt(effective_to) if effective_to else None,
+            scenario_condition=_json_loads(scenario_json) if scenario_json else None,
             is_active=bool(is_active),
             priority=priority,
             description=description,
-            created_at=datetime.fromisoformat(created_at) if created_at else None
+            created_at=_parse_dt(created_at) if created_at else None
         )
 
+    @classmethod
+    def from_db_rows(cls, rows) -> List['SemanticVersion']:
+        """Create instances from many database rows at once"""
+        from_row = cls.from_db_row
+        return [from_row(row) for row in rows]
+
     def is_effective(self, timestamp: Optional[datetime] = None) -> bool:
         """Check if this version is effective at given timestamp"""
         if not self.is_active:
             return False
 
         ts = timestamp or datetime.now()
+        memo = self._last_effective
+        if memo is not None and memo[0] == ts:
+            return memo[1]
+
+        result = True
         if ts < self.effective_from:
-            return False
-        if self.effective_to and ts > self.effective_to:
-            return False
-        return True
+            result = False
+        elif self.effective_to and ts > self.effective_to:
+            result = False
+        self._last_effective = (ts, result)
+        return result
 
     def matches_scenario(self, scenario: Optional[Dict[str, Any]]) -> bool:
         """Check if this version matches the given scenario conditions"""
-        if not self.scenario_condition:
+        if self._cond_items is None:
             # No condition means this is the default version
             return True
 
@@ -312,18 +537,58 @@ class SemanticVersion:
             # If there's a condition but no scenario provided, don't match
             return False
 
-        # Simple matching: all key-value pairs in condition must match scenario
-        for key, value in self.scenario_condition.items():
-            if scenario.get(key) != value:
-                return False
-        return True
+        key = tuple(scenario.items())
+        memo = self._last_scenario
+        if memo is not None and memo[0] == key:
+            return memo[1]
+
+        # All key-value pairs in the condition must appear in the scenario
+        cond_items = self._cond_items
+        if isinstance(cond_items, frozenset):
+            result = cond_items <= scenario.items()
+        else:
+            # Unhashable condition values: per-key equality
+            get = scenario.get
+            result = all(get(k, _MISS) == v for k, v in cond_items)
+        self._last_scenario = (key, result)
+        return result
+
+    def __eq__(self, other) -> bool:
+        # DB-identity semantics, matching SemanticObject.
+        return type(self) is type(other) and self.id == other.id
+
+    def __hash__(self) -> int:
+        return hash((type(self).__name__, self.id))
 
     def __repr__(self) -> str:
         return f"SemanticVersion(id={self.id}, name='{self.version_name}', active={self.is_active})"
 
 
-@dataclass
-class LogicalDefinition:
+def versions_effective_at(
+    versions: List[SemanticVersion],
+    timestamp: Optional[datetime] = None
+) -> List[SemanticVersion]:
+    """
+    Filter many versions for effectiveness at a single timestamp.
+
+    Resolves the reference timestamp once and scans in one pass instead
+    of calling is_effective per version (which re-reads the clock when
+    no timestamp is given).
+    """
+    ts = timestamp or datetime.now()
+    result = []
+    for version in versions:
+        if not version.is_active:
+            continue
+        if ts < version.effective_from:
+            continue
+        if version.effective_to and ts > version.effective_to:
+            continue
+        result.append(version)
+    return result
+
+
+class LogicalDefinition(NamedTuple):
     """
     Pure business logic formula.
     Contains NO physical implementation details (no table names, no SQL).
@@ -346,16 +611,21 @@ class LogicalDefinition:
             expression=expression,
             grain=grain,
             description=description,
-            variables=json.loads(variables_json) if variables_json else [],
-            created_at=datetime.fromisoformat(created_at) if created_at else None
+            variables=_loads_list(variables_json),
+            created_at=_parse_dt(created_at) if created_at else None
         )
 
+    @classmethod
+    def from_db_rows(cls, rows) -> List['LogicalDefinition']:
+        """Create instances from many database rows at once"""
+        from_row = cls.from_db_row
+        return [from_row(row) for row in rows]
+
     def __repr__(self) -> str:
         return f"LogicalDefinition(id={self.id}, expression='{self.expression}', grain='{self.grain}')"
 
 
-@dataclass
-class PhysicalMapping:
+class PhysicalMapping(NamedTuple):
     """
     Maps logical definition to actual SQL implementation.
     This is WHERE and HOW the calculation happens physically.
@@ -378,20 +648,26 @@ class PhysicalMapping:
         return cls(
             id=id,
             logical_definition_id=logical_definition_id,
-            engine_type=engine_type,
+            engine_type=sys.intern(engine_type),
             connection_ref=connection_ref,
             sql_template=sql_template,
-            params_schema=json.loads(params_schema_json) if params_schema_json else {},
+            params_schema=_loads_dict(params_schema_json),
             priority=priority,
             description=description,
-            created_at=datetime.fromisoformat(created_at) if created_at else None
+            created_at=_parse_dt(created_at) if created_at else None
         )
 
+    @classmethod
+    def from_db_rows(cls, rows) -> List['PhysicalMapping']:
+        """Create instances from many database rows at once"""
+        from_row = cls.from_db_row
+        return [from_row(row) for row in rows]
+
     def __repr__(self) -> str:
         return f"PhysicalMapping(id={self.id}, engine='{self.engine_type}', priority={self.priority})"
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class AccessPolicy:
     """
     Authorization policy for semantic object access.
@@ -405,6 +681,17 @@ class AccessPolicy:
     effect: str  # 'allow' or 'deny'
     priority: int
     created_at: Optional[datetime] = None
+    # Condition pairs precompiled once so per-request matching iterates a
+    # tuple instead of re-walking the dict; None means unconditional.
+    _cond_items: Optional[tuple] = field(init=False, repr=False, compare=False)
+    # Effect predigested to a bool so policy evaluation branches on a flag
+    # instead of comparing strings per policy. The public field stays the
+    # DB's 'allow'/'deny' string.
+    _is_deny: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._cond_items = tuple(self.condition.items()) if self.condition else None
+        self._is_deny = self.effect == 'deny'
 
     @classmethod
     def from_db_row(cls, row: tuple) -> 'AccessPolicy':
@@ -414,19 +701,47 @@ class AccessPolicy:
         return cls(
             id=id,
             semantic_object_id=semantic_object_id,
-            role=role,
-            action=action,
-            condition=json.loads(condition_json) if condition_json else None,
-            effect=effect,
+            role=sys.intern(role),
+            action=sys.intern(action),
+            condition=_json_loads(condition_json) if condition_json else None,
+            effect=sys.intern(effect),
             priority=priority,
-            created_at=datetime.fromisoformat(created_at) if created_at else None
+            created_at=_parse_dt(created_at) if created_at else None
         )
 
+    @classmethod
+    def from_db_rows(cls, rows) -> List['AccessPolicy']:
+        """Create instances from many database rows at once"""
+        from_row = cls.from_db_row
+        return [from_row(row) for row in rows]
+
     def __repr__(self) -> str:
         return f"AccessPolicy(id={self.id}, role='{self.role}', effect='{self.effect}')"
 
 
-@dataclass
+@dataclass(slots=True)
+class PolicyDecision:
+    """
+    Outcome of a policy evaluation.
+
+    Replaces the ad-hoc decision dicts that were allocated on every
+    check; slots keep the per-query footprint small and attribute access
+    direct.
+    """
+    allow: bool
+    reason: str
+    policies: tuple = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable summary (matched policies reduced to a count)"""
+        return {
+            'allow': self.allow,
+            'reason': self.reason,
+            'policy_count': len(self.policies)
+        }
+
+
+@dataclass(slots=True, eq=False)
 class ExecutionAudit:
     """
     Complete audit trail for semantic query execution.
@@ -451,10 +766,14 @@ class ExecutionAudit:
     connection_ref: Optional[str]
 
     # Execution
+    # The large JSON payload columns accept either parsed dicts or the raw
+    # JSON strings from the DB; raw strings are decoded lazily on first
+    # access (see the properties attached below the class), so listing or
+    # replaying audits does not pay for payloads it never reads.
     final_sql: Optional[str]
-    decision_trace: Dict[str, Any]
-    request_params: Optional[Dict[str, Any]]
-    execution_context: Optional[Dict[str, Any]]
+    decision_trace: InitVar[Any]
+    request_params: InitVar[Any]
+    execution_context: InitVar[Any]
     user_id: Optional[int]
     user_role: Optional[str]
     policy_decision: Optional[str]
@@ -463,47 +782,18 @@ class ExecutionAudit:
     row_count: Optional[int]
     execution_time_ms: Optional[int]
     error_message: Optional[str]
-
-    @classmethod
-    def from_db_row(cls, row: tuple) -> 'ExecutionAudit':
-        """Create instance from database row"""
-        (
-            id, audit_id, question,
-            semantic_object_id, semantic_object_name,
-            version_id, version_name,
-            logical_definition_id, logical_expression,
-            physical_mapping_id, connection_ref,
-            final_sql, decision_trace_json,
-            request_params_json, execution_context_json,
-            user_id, user_role, policy_decision,
-            executed_at, status, row_count, execution_time_ms, error_message
-        ) = row
-
-        return cls(
-            id=id,
-            audit_id=audit_id,
-            question=question,
-            semantic_object_id=semantic_object_id,
-            semantic_object_name=semantic_object_name,
-            version_id=version_id,
-            version_name=version_name,
-            logical_definition_id=logical_definition_id,
-            logical_expression=logical_expression,
-            physical_mapping_id=physical_mapping_id,
-            connection_ref=connection_ref,
-            final_sql=final_sql,
-            decision_trace=json.loads(decision_trace_json) if decision_trace_json else {},
-            request_params=json.loads(request_params_json) if request_params_json else None,
-            execution_context=json.loads(execution_context_json) if execution_context_json else None,
-            user_id=user_id,
-            user_role=user_role,
-            policy_decision=policy_decision,
-            executed_at=datetime.fromisoformat(executed_at) if executed_at else None,
-            status=status,
-            row_count=row_count,
-            execution_time_ms=execution_time_ms,
-            error_message=error_message
-        )
+    _decision_trace: Any = field(init=False, repr=False, compare=False, default=None)
+    _request_params: Any = field(init=False, repr=False, compare=False, default=None)
+    _execution_context: Any = field(init=False, repr=False, compare=False, default=None)
+    # Serialized form, cached on first as_json_bytes call; audits are
+    # effectively immutable once written, so re-serializing for logging
+    # plus the API response would duplicate the whole encode.
+    _json_bytes: Optional[bytes] = field(init=False, repr=False, compare=False, default=None)
+
+    def __post_init__(self, decision_trace, request_params, execution_context):
+        self._decision_trace = decision_trace
+        self._request_params = request_params
+        self._execution_context = execution_context
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
@@ -542,11 +832,172 @@ class ExecutionAudit:
             'error_message': self.error_message
         }
 
+    def trace_as_json(self) -> str:
+        """JSON text for the decision trace, without a decode round-trip.
+
+        Payloads still raw from the DB are returned verbatim; parsed
+        payloads are encoded with the shared compact encoder. Lets the
+        stores persist audits without re-serializing what they loaded.
+        """
+        value = self._decision_trace
+        if isinstance(value, str):
+            return value
+        return json_dumps(value if value is not None else {})
+
+    def request_params_as_json(self) -> Optional[str]:
+        """JSON text for the request parameters, or None when absent"""
+        value = self._request_params
+        if value is None or isinstance(value, str):
+            return value
+        return json_dumps(value)
+
+    def execution_context_as_json(self) -> Optional[str]:
+        """JSON text for the execution context, or None when absent"""
+        value = self._execution_context
+        if value is None or isinstance(value, str):
+            return value
+        return json_dumps(value)
+
+    def as_json_bytes(self) -> bytes:
+        """
+        Serialize directly to JSON bytes.
+
+        JSON payload columns that are still raw strings from the DB are
+        emitted verbatim, skipping the parse-then-reserialize round-trip
+        that to_dict + dumps would pay on the API path.
+        """
+        if self._json_bytes is not None:
+            return self._json_bytes
+
+        if _orjson is None:
+            from json import dumps
+            self._json_bytes = dumps(self.to_dict(), ensure_ascii=False).encode('utf-8')
+            return self._json_bytes
+
+        def passthrough(value, empty):
+            if isinstance(value, (str, bytes)):
+                if _json_fragment is not None:
+                    return _json_fragment(value)
+                value = _json_loads(value)
+            return value if value is not None else empty
+
+        self._json_bytes = _orjson.dumps({
+            'audit_id': self.audit_id,
+            'question': self.question,
+            'semantic_object': {
+                'id': self.semantic_object_id,
+                'name': self.semantic_object_name
+            },
+            'version': {
+                'id': self.version_id,
+                'name': self.version_name
+            },
+            'logical_definition': {
+                'id': self.logical_definition_id,
+                'expression': self.logical_expression
+            },
+            'physical_mapping': {
+                'id': self.physical_mapping_id,
+                'connection_ref': self.connection_ref
+            },
+            'final_sql': self.final_sql,
+            'decision_trace': passthrough(self._decision_trace, {}),
+            'request_params': passthrough(self._request_params, None),
+            'execution_context': passthrough(self._execution_context, None),
+            'user': {
+                'id': self.user_id,
+                'role': self.user_role
+            },
+            'policy_decision': self.policy_decision,
+            'executed_at': self.executed_at.isoformat() if self.executed_at else None,
+            'status': self.status,
+            'row_count': self.row_count,
+            'execution_time_ms': self.execution_time_ms,
+            'error_message': self.error_message
+        })
+        return self._json_bytes
+
     def __repr__(self) -> str:
         return f"ExecutionAudit(audit_id='{self.audit_id}', status='{self.status}')"
 
 
-@dataclass
+# ExecutionAudit hydration is the bulk-load hot path (23 columns per row),
+# so its row parser is compiled rather than handwritten.
+ExecutionAudit.from_db_row = _compile_from_db_row(ExecutionAudit, [
+    ("id", "raw"),
+    ("audit_id", "raw"),
+    ("question", "raw"),
+    ("semantic_object_id", "raw"),
+    ("semantic_object_name", "raw"),
+    ("version_id", "raw"),
+    ("version_name", "raw"),
+    ("logical_definition_id", "raw"),
+    ("logical_expression", "raw"),
+    ("physical_mapping_id", "raw"),
+    ("connection_ref", "raw"),
+    ("final_sql", "raw"),
+    ("decision_trace", "raw"),
+    ("request_params", "raw"),
+    ("execution_context", "raw"),
+    ("user_id", "raw"),
+    ("user_role", "intern_opt"),
+    ("policy_decision", "raw"),
+    ("executed_at", "datetime"),
+    ("status", "intern"),
+    ("row_count", "raw"),
+    ("execution_time_ms", "raw"),
+    ("error_message", "raw"),
+])
+
+
+def _lazy_json_property(attr: str, empty):
+    """Property that decodes a raw JSON column on first access."""
+    def getter(self):
+        value = getattr(self, attr)
+        if isinstance(value, (str, bytes)):
+            value = _json_loads(value)
+            setattr(self, attr, value)
+        return value if value is not None else empty
+
+    def setter(self, value):
+        setattr(self, attr, value)
+        # A mutated payload invalidates any cached serialized form.
+        self._json_bytes = None
+
+    return property(getter, setter)
+
+
+ExecutionAudit.decision_trace = _lazy_json_property('_decision_trace', {})
+ExecutionAudit.request_params = _lazy_json_property('_request_params', None)
+ExecutionAudit.execution_context = _lazy_json_property('_execution_context', None)
+
+
+# Per-request shared clock: within a request_clock() scope every
+# ExecutionContext reuses one datetime.now() reading instead of paying
+# the clock syscall per object.
+_request_ts: ContextVar[Optional[datetime]] = ContextVar('_request_ts', default=None)
+
+
+@contextmanager
+def request_clock():
+    """Pin the request timestamp for the enclosed scope.
+
+    The orchestrator opens one scope per query; ExecutionContext
+    defaults and request_now() inside it all see the same reading.
+    """
+    token = _request_ts.set(datetime.now())
+    try:
+        yield
+    finally:
+        _request_ts.reset(token)
+
+
+def request_now() -> datetime:
+    """The pinned request timestamp, or a fresh reading outside a scope."""
+    return _request_ts.get() or datetime.now()
+
+
+@dataclass(slots=True, eq=False)
 class ExecutionContext:
     """
     Execution context for a semantic query.
@@ -555,16 +1006,80 @@ class ExecutionContext:
     user_id: int
     role: str
     parameters: Dict[str, Any]
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: datetime = field(default_factory=lambda: _request_ts.get() or datetime.now())
+    # Built on first to_dict() call; contexts are effectively immutable
+    # once a query starts, so repeated audits reuse the same dict.
+    _dict_cache: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _json_cache: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary"""
-        return {
-            'user_id': self.user_id,
-            'role': self.role,
-            'parameters': self.parameters,
-            'timestamp': self.timestamp.isoformat()
-        }
+        """Convert to dictionary (cached after the first call)"""
+        cached = self._dict_cache
+        if cached is None:
+            cached = {
+                'user_id': self.user_id,
+                'role': self.role,
+                'parameters': self.parameters,
+                'timestamp': self.timestamp.isoformat()
+            }
+            self._dict_cache = cached
+        return cached
+
+    def to_json(self) -> str:
+        """JSON text form, serialized once per context.
+
+        The same context is written with the audit and again on the
+        denied path; caching the string means one encode per query.
+        """
+        cached = self._json_cache
+        if cached is None:
+            cached = self._json_cache = json_dumps(self.to_dict())
+        return cached
+
+
+class SemanticObjectIndex:
+    """
+    Flat term -> object lookup index over a set of semantic objects.
+
+    Collapses every object's lowercased name and aliases into one dict so
+    exact-term resolution is a single lookup regardless of corpus size,
+    instead of calling matches_alias on each object in turn.
+    """
+
+    def __init__(self, objects: List[SemanticObject]):
+        self._by_term: Dict[str, int] = {}
+        self._by_id: Dict[int, SemanticObject] = {}
+        for obj in objects:
+            self._by_id[obj.id] = obj
+            self._by_term[obj.name.lower()] = obj.id
+            for alias in obj.aliases:
+                self._by_term[alias.lower()] = obj.id
+
+    def resolve(self, term: str) -> Optional[SemanticObject]:
+        """Resolve a term to its semantic object, or None if unknown."""
+        obj_id = self._by_term.get(term.lower())
+        if obj_id is None:
+            return None
+        return self._by_id.get(obj_id)
+
+
+@dataclass(slots=True, frozen=True, eq=False)
+class GraphSnapshot:
+    """
+    Columnar snapshot of all dependency-graph edges, fetched from the
+    metadata store in one round-trip instead of per-entity fan-out.
+    Each field is a list of (src_id, dst_id) pairs for one edge kind.
+    """
+    metric_entity_edges: List[tuple]       # (metric_id, entity_id)
+    metric_dimension_edges: List[tuple]    # (metric_id, dimension_id)
+    metric_attribute_edges: List[tuple]    # (metric_id, attribute_id)
+    metric_mapping_edges: List[tuple]      # (metric_id, mapping_id)
+    version_dependency_edges: List[tuple]  # (downstream_version_id, upstream_version_id)
+    metric_dependency_edges: List[tuple]   # (downstream_metric_id, upstream_metric_id)
 
 
 # ============================================================
@@ -8,15 +8,23 @@ This is the brain of the semantic control plane.
 """
 
 import logging
+import queue
+import threading
+import time
 import uuid
-from typing import Dict, Any, Optional, List
-from datetime import datetime
-import json
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from typing import Dict, Any, Optional, List, NamedTuple
+from datetime import datetime, timedelta
 
 from .models import (
     SemanticObject, SemanticVersion, LogicalDefinition,
     PhysicalMapping, ExecutionContext, ExecutionAudit,
-    PolicyDeniedError, AmbiguityError, VersionNotFoundError
+    PolicyDecision, PolicyDeniedError, AmbiguityError, VersionNotFoundError,
+    json_dumps, request_clock, request_now
 )
 from .semantic_resolver import SemanticResolver
 from .policy_engine import PolicyEngine
@@ -41,6 +49,135 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Analysis components shared by all orchestrators over the same metadata
+# store: their internal caches (dependency graph, grain constraints) are
+# a function of the store, so per-orchestrator copies just redo the same
+# metadata reads. Weak keys let the entries die with the store.
+_shared_components: 'weakref.WeakKeyDictionary' = weakref.WeakKeyDictionary()
+
+
+def _components_for(metadata_store: MetadataStore) -> tuple:
+    """Return the shared (ImpactAnalyzer, DependencyBuilder, GrainValidator)."""
+    components = _shared_components.get(metadata_store)
+    if components is None:
+        components = (
+            ImpactAnalyzer(metadata_store),
+            DependencyBuilder(metadata_store),
+            GrainValidator(metadata_store),
+        )
+        _shared_components[metadata_store] = components
+    return components
+
+
+def _freeze(value: Any) -> Any:
+    """Canonical hashable form of a scenario value for plan-cache keys."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, set):
+        return frozenset(_freeze(v) for v in value)
+    return value
+
+
+class CachedPlan(NamedTuple):
+    """Resolution chain cached for repeated identical questions.
+
+    ``prepared`` is a closure with the resolved objects already bound, so
+    a cache hit dispatches straight into the prepared execution path
+    instead of re-threading the plan through the general control flow.
+    """
+    semantic_obj: SemanticObject
+    version: SemanticVersion
+    logical_def: LogicalDefinition
+    physical_mapping: PhysicalMapping
+    prepared: Any
+
+
+class TraceBuffer:
+    """
+    Lazily materialized decision trace.
+
+    Steps are recorded as (name, perf_counter_ns, data) tuples on the hot
+    path; per-step ISO timestamps are reconstructed in one pass when the
+    trace is read for the response or the audit record, instead of paying
+    datetime.now().isoformat() on every step.
+    """
+
+    __slots__ = ('_epoch', '_origin_ns', '_steps', '_materialized')
+
+    def __init__(self):
+        self._epoch = datetime.now()
+        self._origin_ns = time.perf_counter_ns()
+        self._steps: List[tuple] = []
+        self._materialized: Optional[List[Dict[str, Any]]] = None
+
+    def add(self, step: str, data: Dict[str, Any]) -> None:
+        self._materialized = None
+        self._steps.append((step, time.perf_counter_ns(), data))
+
+    @contextmanager
+    def step(self, name: str, **data: Any):
+        """
+        Record one fused trace entry for a step.
+
+        The yielded dict carries the step's input fields; output fields
+        are merged in via update() and the measured duration is added on
+        exit. One entry is appended per step instead of a start/complete
+        pair — also when the step raises, preserving the inputs.
+        """
+        start_ns = time.perf_counter_ns()
+        try:
+            yield data
+        finally:
+            data['duration_ns'] = time.perf_counter_ns() - start_ns
+            self.add(name, data)
+
+    def to_columnar(self) -> Dict[str, Any]:
+        """
+        Column-oriented trace payload for compact audit storage.
+
+        Step names, nanosecond offsets and data dicts are emitted as
+        parallel arrays against a single epoch, skipping the per-step
+        wrapper dicts and ISO timestamps that materialize() builds.
+        """
+        origin_ns = self._origin_ns
+        return {
+            'format': 'columnar',
+            'epoch': self._epoch.isoformat(),
+            's': [step for step, _, _ in self._steps],
+            't': [ns - origin_ns for _, ns, _ in self._steps],
+            'd': [data for _, _, data in self._steps],
+        }
+
+    def materialize(self) -> List[Dict[str, Any]]:
+        if self._materialized is None:
+            epoch = self._epoch
+            origin_ns = self._origin_ns
+            self._materialized = [
+                {
+                    'step': step,
+                    'timestamp': (epoch + timedelta(microseconds=(ns - origin_ns) // 1000)).isoformat(),
+                    'data': data
+                }
+                for step, ns, data in self._steps
+            ]
+        return self._materialized
+
+
+def _expand_columnar_trace(trace: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Rebuild per-step trace dicts from the columnar storage form."""
+    epoch = datetime.fromisoformat(trace['epoch'])
+    return [
+        {
+            'step': step,
+            'timestamp': (epoch + timedelta(microseconds=offset_ns // 1000)).isoformat(),
+            'data': data
+        }
+        for step, offset_ns, data in zip(trace['s'], trace['t'], trace['d'])
+    ]
+
+
 class SemanticOrchestrator:
     """
     Main orchestrator for semantic queries.
@@ -87,6 +224,7 @@ class SemanticOrchestrator:
                 raise ValueError("db_path is required when stores/executor are not provided")
 
         self.default_engine_type = config.default_engine_type if config else "sqlite"
+        self._compact_trace = config.compact_trace if config else False
         self.metadata_store = metadata_store or SQLiteMetadataStore(db_path)
         self.policy_store = policy_store or SQLitePolicyStore(db_path)
         self.audit_store = audit_store or SQLiteAuditStore(db_path)
@@ -99,11 +237,39 @@ class SemanticOrchestrator:
             metadata_store=self.metadata_store,
             query_executor=self.query_executor
         )
-        self.impact_analyzer = ImpactAnalyzer(self.metadata_store)
-        self.dependency_builder = DependencyBuilder(self.metadata_store)
-        self.grain_validator = GrainValidator(self.metadata_store)
+        self.impact_analyzer, self.dependency_builder, self.grain_validator = \
+            _components_for(self.metadata_store)
+
+        # Plan cache: repeated questions skip the resolver, version, logic
+        # and mapping store round-trips. Grain validation and policy checks
+        # still run per request because they depend on parameter values.
+        self._plan_cache: 'OrderedDict[tuple, CachedPlan]' = OrderedDict()
+        self._plan_cache_max = 1000
+
+        # Audit writes are drained by a background thread in batches so
+        # the request path never pays the per-insert SQLite commit. Reads
+        # (replay, history) flush the queue first for read-your-writes.
+        self._audit_queue: 'queue.Queue' = queue.Queue()
+        self._audit_batch_max = 128
+        self._audit_thread = threading.Thread(
+            target=self._audit_drainer,
+            name='audit-drainer',
+            daemon=True
+        )
+        self._audit_thread.start()
 
-        logger.info(f"SemanticOrchestrator initialized with database: {db_path}")
+        # Pool for overlapping independent store reads (physical mapping
+        # and policy check are both I/O-bound and share no data).
+        self._io_pool = ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix='orchestrator-io'
+        )
+
+        # Audit id prefix is rebuilt at most once per second; a benign
+        # race between threads produces identical prefixes.
+        self._audit_id_prefix = ''
+        self._audit_id_second = 0
+
+        logger.info("SemanticOrchestrator initialized with database: %s", db_path)
 
     # ============================================================
     # MAIN QUERY FLOW
@@ -128,246 +294,237 @@ class SemanticOrchestrator:
         Returns:
             Result dict with decision trace and data
         """
+        # One clock reading per request: the audit's executed_at and any
+        # contexts constructed inside the scope share it instead of each
+        # taking their own datetime.now().
+        with request_clock():
+            return self._query(question, parameters, context, preview_only)
+
+    def _query(
+        self,
+        question: str,
+        parameters: Dict[str, Any],
+        context: ExecutionContext,
+        preview_only: bool
+    ) -> Dict[str, Any]:
         audit_id = self._generate_audit_id()
-        decision_trace = []
-        trace = lambda step, data: decision_trace.append({
-            'step': step,
-            'timestamp': datetime.now().isoformat(),
-            'data': data
-        })
+        trace_buffer = TraceBuffer()
+        trace = trace_buffer.add
 
-        logger.info("=" * 80)
-        logger.info(f"SEMANTIC QUERY: {question}")
-        logger.info(f"Audit ID: {audit_id}")
-        logger.info("=" * 80)
+        # %s-style args are only interpolated when INFO is enabled
+        logger.info("SEMANTIC QUERY: %s (audit=%s)", question, audit_id)
 
         semantic_obj = None
         version = None
         logical_def = None
         physical_mapping = None
-        policy_decision = None
-        execution_result = None
+        # Mutated by the prepared path once STEP 9 persists the record, so
+        # the error handlers don't write a second audit row for failures
+        # that happen after the success audit was already saved.
+        audit_saved = [False]
+
+        scenario_provided = parameters.get('scenario')
+        # Scenario values are part of the key, not just the parameter
+        # shape: the same question selects different versions for
+        # different scenarios, and an unconditional cached version would
+        # otherwise satisfy the matches_scenario re-check for any of them.
+        plan_key = (
+            question.strip().lower(),
+            context.role,
+            tuple(sorted(parameters.keys())),
+            _freeze(scenario_provided) if scenario_provided else None
+        )
 
         try:
-            # STEP 1: Resolve semantic object
-            trace('resolve_semantic_object_start', {
-                'question': question,
-                'semantic_object_reason': 'Extracting semantic object from natural language'
-            })
-            semantic_obj = self.resolver.resolve_semantic_object(question)
-            trace('resolve_semantic_object_complete', {
-                'semantic_object_id': semantic_obj.id,
-                'semantic_object_name': semantic_obj.name,
-                'semantic_object_reason': f'Matched semantic object "{semantic_obj.name}" (domain: {semantic_obj.domain}, aliases: {semantic_obj.aliases})'
-            })
-
-            # STEP 2: Resolve version
-            scenario_provided = parameters.get('scenario')
-            trace('resolve_version_start', {
-                'semantic_object_id': semantic_obj.id,
-                'scenario_evaluated': scenario_provided,
-                'version_selection_reason': 'Evaluating versions based on scenario match and time effectiveness'
-            })
-            version = self.resolver.resolve_version(
-                semantic_obj.id,
-                scenario=parameters.get('scenario'),
-                timestamp=context.timestamp
-            )
-            trace('resolve_version_complete', {
-                'version_id': version.id,
-                'version_name': version.version_name,
-                'scenario_condition': version.scenario_condition,
-                'version_selection_reason': f'Selected version "{version.version_name}" - scenario_match={scenario_provided is not None and version.scenario_condition is not None}'
-            })
-
-            # STEP 3: Resolve logic
-            trace('resolve_logic_start', {
-                'version_id': version.id,
-                'logic_resolution_reason': 'Resolving business logic formula from version definition'
-            })
-            logical_def = self.resolver.resolve_logic(version.id)
-            trace('resolve_logic_complete', {
-                'logical_definition_id': logical_def.id,
-                'expression': logical_def.expression,
-                'grain': logical_def.grain,
-                'logic_expression': logical_def.expression,
-                'logic_resolution_reason': f'Business logic: {logical_def.expression} (grain: {logical_def.grain})'
-            })
-
-            # STEP 3.5: Grain validation
-            validation = self.grain_validator.validate(semantic_obj.id, parameters, logical_def.grain or "")
-            trace('grain_validation', validation)
-            if validation.get("status") == "FAIL":
-                reason = validation.get("reason", "Grain validation failed")
-                suggestions = validation.get("suggestions", {})
-                if suggestions:
-                    reason = f"{reason}. Suggestions: {suggestions}"
-                raise ValueError(reason)
-
-            # STEP 4: Resolve physical mapping
-            trace('resolve_physical_mapping_start', {
-                'logical_definition_id': logical_def.id,
-                'physical_mapping_reason': 'Mapping logical definition to SQL implementation'
-            })
-            physical_mapping = self.execution_engine.resolve_physical_mapping(
-                logical_def.id,
-                engine_type=self.default_engine_type
-            )
-            trace('resolve_physical_mapping_complete', {
-                'physical_mapping_id': physical_mapping.id,
-                'engine_type': physical_mapping.engine_type,
-                'connection_ref': physical_mapping.connection_ref,
-                'physical_mapping_reason': f'Selected physical mapping using {physical_mapping.engine_type} engine (priority: {physical_mapping.priority})'
-            })
-
-            # STEP 5: Check access policy
-            trace('policy_check_start', {
-                'semantic_object_id': semantic_obj.id,
-                'user_role': context.role,
-                'policy_check_reason': 'Evaluating access policies'
-            })
-            policy_decision = self.policy_engine.check_access(
-                semantic_object_id=semantic_obj.id,
-                role=context.role,
-                action='query',
-                context=parameters
-            )
-            trace('policy_check_complete', {
-                'policy_decision': 'ALLOW' if policy_decision.get('allow') else 'DENY',
-                'policy_reason': policy_decision.get('reason'),
-                'policy_details': {
-                    'allow': policy_decision.get('allow'),
-                    'reason': policy_decision.get('reason'),
-                    'policy_count': len(policy_decision.get('policies', []))
-                }
-            })
-
-            # STEP 6: Render SQL
-            trace('render_sql_start', {
-                'parameters': parameters,
-                'sql_generation_reason': 'Rendering SQL from Jinja2 template with parameters'
-            })
-            sql = self.execution_engine.render_sql(physical_mapping, parameters)
-            trace('render_sql_complete', {
-                'sql_preview': sql[:200] + '...' if len(sql) > 200 else sql
-            })
-
-            # STEP 7: Preview or execute
-            if preview_only:
-                trace('preview_complete', {
-                    'preview': True,
-                    'sql': sql
+            cached_plan = self._plan_cache.get(plan_key)
+            if cached_plan is not None and not (
+                cached_plan.version.is_effective(context.timestamp)
+                and cached_plan.version.matches_scenario(scenario_provided)
+            ):
+                # Cached version no longer applies at this timestamp or for
+                # this scenario value; fall back to full resolution.
+                del self._plan_cache[plan_key]
+                cached_plan = None
+
+            if cached_plan is not None:
+                # STEPS 1-4 from cache: skip resolver, version, logic and
+                # mapping store round-trips for a repeated question.
+                self._plan_cache.move_to_end(plan_key)
+                semantic_obj = cached_plan.semantic_obj
+                version = cached_plan.version
+                logical_def = cached_plan.logical_def
+                physical_mapping = cached_plan.physical_mapping
+
+                trace('plan_cache_hit', {
+                    'plan_reason': 'Reusing resolution chain cached for identical question, role, parameter shape and scenario'
                 })
-
-                logger.info("=" * 80)
-                logger.info("PREVIEW MODE - SQL NOT EXECUTED")
-                logger.info("=" * 80)
-
-                return {
-                    'audit_id': audit_id,
-                    'status': 'preview',
-                    'semantic_object': semantic_obj.name,
-                    'version': version.version_name,
-                    'logic': logical_def.expression,
-                    'sql': sql,
-                    'decision_trace': decision_trace
-                }
-
-            # STEP 8: Execute
-            trace('execution_start', {
-                'sql': sql,
-                'execution_reason': 'Executing generated SQL against data source'
-            })
-            execution_result = self.execution_engine.execute(
-                sql,
-                physical_mapping.connection_ref,
-                parameters
-            )
-            trace('execution_complete', {
-                'row_count': execution_result.row_count,
-                'execution_time_ms': execution_result.execution_time_ms,
-                'execution_result': 'Query executed successfully' if execution_result.success else f'Query failed: {execution_result.error}'
-            })
-
-            # STEP 9: Audit
-            audit_record = self._create_audit_record(
+                trace('resolve_semantic_object', {
+                    'semantic_object_id': semantic_obj.id,
+                    'semantic_object_name': semantic_obj.name,
+                    'semantic_object_reason': f'Matched semantic object "{semantic_obj.name}" (domain: {semantic_obj.domain}, aliases: {semantic_obj.aliases})'
+                })
+                trace('resolve_version', {
+                    'version_id': version.id,
+                    'version_name': version.version_name,
+                    'scenario_condition': version.scenario_condition,
+                    'version_selection_reason': f'Selected version "{version.version_name}" - scenario_match={scenario_provided is not None and version.scenario_condition is not None}'
+                })
+                trace('resolve_logic', {
+                    'logical_definition_id': logical_def.id,
+                    'expression': logical_def.expression,
+                    'grain': logical_def.grain,
+                    'logic_expression': logical_def.expression,
+                    'logic_resolution_reason': f'Business logic: {logical_def.expression} (grain: {logical_def.grain})'
+                })
+                trace('resolve_physical_mapping', {
+                    'physical_mapping_id': physical_mapping.id,
+                    'engine_type': physical_mapping.engine_type,
+                    'connection_ref': physical_mapping.connection_ref,
+                    'physical_mapping_reason': f'Selected physical mapping using {physical_mapping.engine_type} engine (priority: {physical_mapping.priority})'
+                })
+                prepared = cached_plan.prepared
+            else:
+                # STEP 1: Resolve semantic object
+                with trace_buffer.step(
+                    'resolve_semantic_object',
+                    question=question,
+                    semantic_object_reason='Extracting semantic object from natural language'
+                ) as step:
+                    semantic_obj = self.resolver.resolve_semantic_object(question)
+                    step.update(
+                        semantic_object_id=semantic_obj.id,
+                        semantic_object_name=semantic_obj.name,
+                        semantic_object_reason=f'Matched semantic object "{semantic_obj.name}" (domain: {semantic_obj.domain}, aliases: {semantic_obj.aliases})'
+                    )
+
+                # STEP 2: Resolve version
+                with trace_buffer.step(
+                    'resolve_version',
+                    semantic_object_id=semantic_obj.id,
+                    scenario_evaluated=scenario_provided,
+                    version_selection_reason='Evaluating versions based on scenario match and time effectiveness'
+                ) as step:
+                    version = self.resolver.resolve_version(
+                        semantic_obj.id,
+                        scenario=parameters.get('scenario'),
+                        timestamp=context.timestamp
+                    )
+                    step.update(
+                        version_id=version.id,
+                        version_name=version.version_name,
+                        scenario_condition=version.scenario_condition,
+                        version_selection_reason=f'Selected version "{version.version_name}" - scenario_match={scenario_provided is not None and version.scenario_condition is not None}'
+                    )
+
+                # STEP 3: Resolve logic
+                with trace_buffer.step(
+                    'resolve_logic',
+                    version_id=version.id,
+                    logic_resolution_reason='Resolving business logic formula from version definition'
+                ) as step:
+                    logical_def = self.resolver.resolve_logic(version.id)
+                    step.update(
+                        logical_definition_id=logical_def.id,
+                        expression=logical_def.expression,
+                        grain=logical_def.grain,
+                        logic_expression=logical_def.expression,
+                        logic_resolution_reason=f'Business logic: {logical_def.expression} (grain: {logical_def.grain})'
+                    )
+
+                # STEP 4: Resolve physical mapping, overlapped with the
+                # STEP 5 policy read — both depend only on STEP 3 output.
+                # Trace entries keep their usual order: the policy_check
+                # entry is appended when the future is consumed in STEP 5.
+                policy_future = self._io_pool.submit(
+                    self.policy_engine.check_access,
+                    semantic_object_id=semantic_obj.id,
+                    role=context.role,
+                    action='query',
+                    context=parameters
+                )
+                with trace_buffer.step(
+                    'resolve_physical_mapping',
+                    logical_definition_id=logical_def.id,
+                    physical_mapping_reason='Mapping logical definition to SQL implementation'
+                ) as step:
+                    physical_mapping = self.execution_engine.resolve_physical_mapping(
+                        logical_def.id,
+                        engine_type=self.default_engine_type
+                    )
+                    step.update(
+                        physical_mapping_id=physical_mapping.id,
+                        engine_type=physical_mapping.engine_type,
+                        connection_ref=physical_mapping.connection_ref,
+                        physical_mapping_reason=f'Selected physical mapping using {physical_mapping.engine_type} engine (priority: {physical_mapping.priority})'
+                    )
+
+                prepared = partial(
+                    self._execute_prepared,
+                    semantic_obj, version, logical_def, physical_mapping
+                )
+                self._plan_cache[plan_key] = CachedPlan(
+                    semantic_obj, version, logical_def, physical_mapping, prepared
+                )
+                prepared = partial(prepared, policy_future=policy_future)
+                if len(self._plan_cache) > self._plan_cache_max:
+                    self._plan_cache.popitem(last=False)
+
+            # STEPS 4.5-9 run through the prepared closure with the
+            # resolved plan already bound
+            return prepared(
                 audit_id=audit_id,
                 question=question,
-                semantic_obj=semantic_obj,
-                version=version,
-                logical_def=logical_def,
-                physical_mapping=physical_mapping,
-                sql=sql,
-                decision_trace=decision_trace,
+                parameters=parameters,
                 context=context,
-                policy_decision=policy_decision,
-                execution_result=execution_result,
-                status='success' if execution_result.success else 'error'
+                trace_buffer=trace_buffer,
+                preview_only=preview_only,
+                audit_saved=audit_saved
             )
 
-            self._save_audit(audit_record)
-
-            logger.info("=" * 80)
-            logger.info(f"QUERY COMPLETE - Status: {audit_record.status}")
-            logger.info(f"Audit ID: {audit_id}")
-            logger.info(f"Row Count: {execution_result.row_count}")
-            logger.info("=" * 80)
-
-            return {
-                'audit_id': audit_id,
-                'status': audit_record.status,
-                'semantic_object': semantic_obj.name,
-                'version': version.version_name,
-                'logic': logical_def.expression,
-                'sql': sql,
-                'data': execution_result.data,
-                'row_count': execution_result.row_count,
-                'execution_time_ms': execution_result.execution_time_ms,
-                'decision_trace': decision_trace
-            }
-
         except PolicyDeniedError as e:
             # Policy denied - audit and return
             trace('policy_denied', {'reason': str(e)})
-            self._audit_denied(
-                audit_id=audit_id,
-                question=question,
-                semantic_obj=semantic_obj,
-                decision_trace=decision_trace,
-                context=context,
-                error=str(e)
-            )
-
-            logger.warning(f"ACCESS DENIED: {e}")
+            if not audit_saved[0]:
+                self._audit_denied(
+                    audit_id=audit_id,
+                    question=question,
+                    semantic_obj=semantic_obj,
+                    decision_trace=trace_buffer.materialize(),
+                    context=context,
+                    error=str(e)
+                )
+
+            logger.warning("ACCESS DENIED: %s", e)
             return {
                 'audit_id': audit_id,
                 'status': 'denied',
                 'error': str(e),
-                'decision_trace': decision_trace
+                'decision_trace': trace_buffer.materialize()
             }
 
         except (AmbiguityError, VersionNotFoundError) as e:
             # Resolution error - audit and return structured error
             trace('resolution_error', {'error': str(e), 'type': type(e).__name__})
 
-            logger.warning(f"RESOLUTION ERROR: {e}")
+            logger.warning("RESOLUTION ERROR: %s", e)
 
             # Audit the error
-            self._audit_denied(
-                audit_id=audit_id,
-                question=question,
-                semantic_obj=semantic_obj,
-                decision_trace=decision_trace,
-                context=context,
-                error=str(e)
-            )
+            if not audit_saved[0]:
+                self._audit_denied(
+                    audit_id=audit_id,
+                    question=question,
+                    semantic_obj=semantic_obj,
+                    decision_trace=trace_buffer.materialize(),
+                    context=context,
+                    error=str(e)
+                )
 
             error_response = {
                 'audit_id': audit_id,
                 'status': 'error',
                 'error_type': type(e).__name__,
                 'error': str(e),
-                'decision_trace': decision_trace
+                'decision_trace': trace_buffer.materialize()
             }
 
             if isinstance(e, AmbiguityError):
@@ -378,24 +535,172 @@ class SemanticOrchestrator:
         except Exception as e:
             # Unexpected error
             trace('unexpected_error', {'error': str(e)})
-            logger.error(f"UNEXPECTED ERROR: {e}", exc_info=True)
-
-            self._audit_denied(
-                audit_id=audit_id,
-                question=question,
-                semantic_obj=semantic_obj,
-                decision_trace=decision_trace,
-                context=context,
-                error=str(e)
-            )
+            logger.error("UNEXPECTED ERROR: %s", e, exc_info=True)
+
+            if not audit_saved[0]:
+                self._audit_denied(
+                    audit_id=audit_id,
+                    question=question,
+                    semantic_obj=semantic_obj,
+                    decision_trace=trace_buffer.materialize(),
+                    context=context,
+                    error=str(e)
+                )
 
             return {
                 'audit_id': audit_id,
                 'status': 'error',
                 'error': str(e),
-                'decision_trace': decision_trace
+                'decision_trace': trace_buffer.materialize()
+            }
+
+    def _execute_prepared(
+        self,
+        semantic_obj: SemanticObject,
+        version: SemanticVersion,
+        logical_def: LogicalDefinition,
+        physical_mapping: PhysicalMapping,
+        audit_id: str,
+        question: str,
+        parameters: Dict[str, Any],
+        context: ExecutionContext,
+        trace_buffer: TraceBuffer,
+        preview_only: bool,
+        audit_saved: Optional[List[bool]] = None,
+        policy_future: Optional[Any] = None
+    ) -> Dict[str, Any]:
+        """
+        Execute steps 4.5-9 for an already-resolved plan.
+
+        The resolution chain is bound once when the plan is cached, so
+        repeated questions dispatch straight here. Grain validation and
+        the policy check still run on every call because they depend on
+        parameter values; errors propagate to query()'s handlers.
+        """
+        trace = trace_buffer.add
+
+        # STEP 4.5: Grain validation (parameter-value dependent, so it
+        # runs on cached plans too)
+        validation = self.grain_validator.validate(semantic_obj.id, parameters, logical_def.grain or "")
+        trace('grain_validation', validation)
+        if validation.get("status") == "FAIL":
+            reason = validation.get("reason", "Grain validation failed")
+            suggestions = validation.get("suggestions", {})
+            if suggestions:
+                reason = f"{reason}. Suggestions: {suggestions}"
+            raise ValueError(reason)
+
+        # STEP 5: Check access policy
+        with trace_buffer.step(
+            'policy_check',
+            semantic_object_id=semantic_obj.id,
+            user_role=context.role,
+            policy_check_reason='Evaluating access policies'
+        ) as step:
+            if policy_future is not None:
+                # Cold path: the check was submitted alongside STEP 4
+                policy_decision = policy_future.result()
+            else:
+                policy_decision = self.policy_engine.check_access(
+                    semantic_object_id=semantic_obj.id,
+                    role=context.role,
+                    action='query',
+                    context=parameters
+                )
+            step.update(
+                policy_decision='ALLOW' if policy_decision.allow else 'DENY',
+                policy_reason=policy_decision.reason,
+                policy_details=policy_decision.to_dict()
+            )
+
+        # STEP 6: Render SQL
+        with trace_buffer.step(
+            'render_sql',
+            parameters=parameters,
+            sql_generation_reason='Rendering SQL from Jinja2 template with parameters'
+        ) as step:
+            sql = self.execution_engine.render_sql(physical_mapping, parameters)
+            step.update(
+                sql_preview=sql[:200] + '...' if len(sql) > 200 else sql
+            )
+
+        # STEP 7: Preview or execute
+        if preview_only:
+            trace('preview_complete', {
+                'preview': True,
+                'sql': sql
+            })
+
+            logger.info("PREVIEW MODE - SQL NOT EXECUTED (audit=%s)", audit_id)
+
+            return {
+                'audit_id': audit_id,
+                'status': 'preview',
+                'semantic_object': semantic_obj.name,
+                'version': version.version_name,
+                'logic': logical_def.expression,
+                'sql': sql,
+                'decision_trace': trace_buffer.materialize()
             }
 
+        # STEP 8: Execute
+        with trace_buffer.step(
+            'execution',
+            sql=sql,
+            execution_reason='Executing generated SQL against data source'
+        ) as step:
+            execution_result = self.execution_engine.execute(
+                sql,
+                physical_mapping.connection_ref,
+                parameters
+            )
+            step.update(
+                row_count=execution_result.row_count,
+                execution_time_ms=execution_result.execution_time_ms,
+                execution_result='Query executed successfully' if execution_result.success else f'Query failed: {execution_result.error}'
+            )
+
+        # STEP 9: Audit
+        audit_record = self._create_audit_record(
+            audit_id=audit_id,
+            question=question,
+            semantic_obj=semantic_obj,
+            version=version,
+            logical_def=logical_def,
+            physical_mapping=physical_mapping,
+            sql=sql,
+            decision_trace=(
+                trace_buffer.to_columnar() if self._compact_trace
+                else trace_buffer.materialize()
+            ),
+            context=context,
+            policy_decision=policy_decision,
+            execution_result=execution_result,
+            status='success' if execution_result.success else 'error'
+        )
+
+        self._save_audit(audit_record)
+        if audit_saved is not None:
+            audit_saved[0] = True
+
+        logger.info(
+            "QUERY COMPLETE - status=%s audit=%s rows=%s",
+            audit_record.status, audit_id, execution_result.row_count
+        )
+
+        return {
+            'audit_id': audit_id,
+            'status': audit_record.status,
+            'semantic_object': semantic_obj.name,
+            'version': version.version_name,
+            'logic': logical_def.expression,
+            'sql': sql,
+            'data': execution_result.data,
+            'row_count': execution_result.row_count,
+            'execution_time_ms': execution_result.execution_time_ms,
+            'decision_trace': trace_buffer.materialize()
+        }
+
     # ============================================================
     # REPLAY FUNCTIONALITY
     # ============================================================
@@ -418,7 +723,7 @@ class SemanticOrchestrator:
         Returns:
             Replay result with previous and new data
         """
-        logger.info(f"REPLAY REQUEST: {audit_id}")
+        logger.info("REPLAY REQUEST: %s", audit_id)
 
         # Load original audit record
         original = self._load_audit(audit_id)
@@ -426,40 +731,31 @@ class SemanticOrchestrator:
         if not original:
             raise ValueError(f"Audit record not found: {audit_id}")
 
-        logger.info(f"Original Query: {original.question}")
-        logger.info(f"Original Status: {original.status}")
-        logger.info(f"Replay Mode: Using original SQL without re-resolution")
+        logger.info("Original Query: %s", original.question)
+        logger.info("Original Status: %s", original.status)
+        logger.info("Replay Mode: Using original SQL without re-resolution")
 
         if original.status != 'success':
-            logger.warning(f"Cannot replay unsuccessful query (status={original.status})")
+            logger.warning("Cannot replay unsuccessful query (status=%s)", original.status)
             return {
                 'error': f'Cannot replay query with status: {original.status}',
                 'original_audit': original.to_dict()
             }
 
-        # Create replay decision trace
-        replay_decision_trace = [
-            {
-                'step': 'replay_start',
-                'timestamp': datetime.now().isoformat(),
-                'data': {
-                    'replay_mode': True,
-                    'replay_source_audit_id': audit_id,
-                    'original_question': original.question,
-                    'original_sql': original.final_sql,
-                    'replay_reason': 'Using original SQL without re-executing semantic resolution or version selection'
-                }
-            },
-            {
-                'step': 'replay_execution_start',
-                'timestamp': datetime.now().isoformat(),
-                'data': {
-                    'sql': original.final_sql,
-                    'connection_ref': original.connection_ref,
-                    'execution_reason': 'Re-executing original SQL'
-                }
-            }
-        ]
+        # Create replay decision trace (timestamps formatted lazily)
+        trace_buffer = TraceBuffer()
+        trace_buffer.add('replay_start', {
+            'replay_mode': True,
+            'replay_source_audit_id': audit_id,
+            'original_question': original.question,
+            'original_sql': original.final_sql,
+            'replay_reason': 'Using original SQL without re-executing semantic resolution or version selection'
+        })
+        trace_buffer.add('replay_execution_start', {
+            'sql': original.final_sql,
+            'connection_ref': original.connection_ref,
+            'execution_reason': 'Re-executing original SQL'
+        })
 
         # Execute original SQL
         execution_result = self.execution_engine.execute(
@@ -467,41 +763,29 @@ class SemanticOrchestrator:
             original.connection_ref
         )
 
-        replay_decision_trace.append({
-            'step': 'replay_execution_complete',
-            'timestamp': datetime.now().isoformat(),
-            'data': {
-                'row_count': execution_result.row_count,
-                'execution_time_ms': execution_result.execution_time_ms,
-                'execution_result': 'Query executed successfully' if execution_result.success else f'Query failed: {execution_result.error}'
-            }
+        trace_buffer.add('replay_execution_complete', {
+            'row_count': execution_result.row_count,
+            'execution_time_ms': execution_result.execution_time_ms,
+            'execution_result': 'Query executed successfully' if execution_result.success else f'Query failed: {execution_result.error}'
         })
 
-        # Create replay audit record
+        replay_decision_trace = trace_buffer.materialize()
+
+        # Create replay audit record directly from the original's fields
         replay_audit_id = self._generate_audit_id()
-        replay_audit = self._create_audit_record(
+        replay_audit = self._create_audit_record_from_replay(
             audit_id=replay_audit_id,
-            question=original.question,
-            semantic_obj=SemanticObject(id=original.semantic_object_id or 0, name=original.semantic_object_name or '', description='', aliases=[], domain='', status=''),
-            version=SemanticVersion(id=original.version_id or 0, semantic_object_id=0, version_name=original.version_name or '', effective_from=datetime.now(), effective_to=None, scenario_condition=None, is_active=True, priority=0),
-            logical_def=LogicalDefinition(id=original.logical_definition_id or 0, semantic_version_id=0, expression=original.logical_expression or '', grain='', description='', variables='[]'),
-            physical_mapping=PhysicalMapping(id=original.physical_mapping_id or 0, logical_definition_id=0, engine_type='', connection_ref=original.connection_ref or '', sql_template=original.final_sql or '', params_schema='', priority=0, description=''),
-            sql=original.final_sql or '',
+            original=original,
             decision_trace=replay_decision_trace,
-            context=ExecutionContext(user_id=original.user_id or 0, role=original.user_role or 'unknown', parameters={}, timestamp=datetime.now()),
-            policy_decision={'allow': True, 'reason': 'Replay uses pre-authorized SQL', 'policy_count': 0},
-            execution_result=execution_result,
-            status='success' if execution_result.success else 'error'
+            execution_result=execution_result
         )
 
         self._save_audit(replay_audit)
 
-        logger.info("=" * 80)
-        logger.info(f"REPLAY COMPLETE - Status: {execution_result.success}")
-        logger.info(f"Original Audit ID: {audit_id}")
-        logger.info(f"New Audit ID: {replay_audit_id}")
-        logger.info(f"Row Count: {execution_result.row_count}")
-        logger.info("=" * 80)
+        logger.info(
+            "REPLAY COMPLETE - success=%s original_audit=%s new_audit=%s rows=%s",
+            execution_result.success, audit_id, replay_audit_id, execution_result.row_count
+        )
 
         return {
             'original_audit_id': audit_id,
@@ -536,15 +820,35 @@ class SemanticOrchestrator:
         Returns:
             List of audit records
         """
+        self.flush_audits()
         return self.audit_store.list_audit_history(limit=limit, user_id=user_id)
 
+    def get_audit_trace(self, audit_id: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get the decision trace for an audit record.
+
+        Traces are stored in a side table so the main audit rows stay
+        small; use this when the full decision path is needed.
+        """
+        self.flush_audits()
+        trace = self.audit_store.get_audit_trace(audit_id)
+        if trace is None:
+            return None
+        if trace.get('format') == 'columnar':
+            return _expand_columnar_trace(trace)
+        return trace.get('steps', [])
+
     # ============================================================
     # UTILITY METHODS
     # ============================================================
 
     def _generate_audit_id(self) -> str:
         """Generate unique audit ID"""
-        return datetime.now().strftime("%Y%m%d_%H%M%S_") + str(uuid.uuid4())[:8]
+        now = int(time.time())
+        if now != self._audit_id_second:
+            self._audit_id_second = now
+            self._audit_id_prefix = time.strftime("%Y%m%d_%H%M%S_", time.localtime(now))
+        return self._audit_id_prefix + uuid.uuid4().hex[:8]
 
     def _create_audit_record(
         self,
@@ -555,21 +859,19 @@ class SemanticOrchestrator:
         logical_def: LogicalDefinition,
         physical_mapping: PhysicalMapping,
         sql: str,
-        decision_trace: List[Dict],
+        decision_trace: Any,
         context: ExecutionContext,
-        policy_decision: Dict,
+        policy_decision: PolicyDecision,
         execution_result: ExecutionResult,
         status: str
     ) -> ExecutionAudit:
-        """Create audit record from query execution"""
-
-        # Convert policy_decision to JSON-serializable format
-        serializable_policy = {
-            'allow': policy_decision.get('allow'),
-            'reason': policy_decision.get('reason'),
-            'policy_count': len(policy_decision.get('policies', []))
-        }
+        """Create audit record from query execution.
 
+        decision_trace is either the materialized step list or the
+        columnar payload when compact traces are enabled.
+        """
+        if isinstance(decision_trace, list):
+            decision_trace = {'steps': decision_trace}
         return ExecutionAudit(
             id=0,  # Will be assigned by DB
             audit_id=audit_id,
@@ -583,23 +885,72 @@ class SemanticOrchestrator:
             physical_mapping_id=physical_mapping.id,
             connection_ref=physical_mapping.connection_ref,
             final_sql=sql,
-            decision_trace={'steps': decision_trace},
+            decision_trace=decision_trace,
             request_params=context.parameters if context.parameters else None,
-            execution_context=context.to_dict(),
+            execution_context=context.to_json(),
             user_id=context.user_id,
             user_role=context.role,
-            policy_decision=json.dumps(serializable_policy),
-            executed_at=datetime.now(),
+            policy_decision=json_dumps(policy_decision.to_dict()),
+            executed_at=request_now(),
             status=status,
             row_count=execution_result.row_count,
             execution_time_ms=execution_result.execution_time_ms,
             error_message=execution_result.error
         )
 
+    def _create_audit_record_from_replay(
+        self,
+        audit_id: str,
+        original: ExecutionAudit,
+        decision_trace: List[Dict],
+        execution_result: ExecutionResult
+    ) -> ExecutionAudit:
+        """
+        Create a replay audit record from the original record's fields.
+
+        Replay only needs the ids/names already stored on the original
+        audit, so this skips the placeholder SemanticObject/Version/
+        LogicalDefinition/PhysicalMapping constructions the normal path
+        would require.
+        """
+        context = ExecutionContext(
+            user_id=original.user_id or 0,
+            role=original.user_role or 'unknown',
+            parameters={},
+            timestamp=datetime.now()
+        )
+        policy_decision = PolicyDecision(allow=True, reason='Replay uses pre-authorized SQL')
+
+        return ExecutionAudit(
+            id=0,  # Will be assigned by DB
+            audit_id=audit_id,
+            question=original.question,
+            semantic_object_id=original.semantic_object_id,
+            semantic_object_name=original.semantic_object_name,
+            version_id=original.version_id,
+            version_name=original.version_name,
+            logical_definition_id=original.logical_definition_id,
+            logical_expression=original.logical_expression,
+            physical_mapping_id=original.physical_mapping_id,
+            connection_ref=original.connection_ref,
+            final_sql=original.final_sql,
+            decision_trace={'steps': decision_trace},
+            request_params=None,
+            execution_context=context.to_json(),
+            user_id=context.user_id,
+            user_role=context.role,
+            policy_decision=json_dumps(policy_decision.to_dict()),
+            executed_at=datetime.now(),
+            status='success' if execution_result.success else 'error',
+            row_count=execution_result.row_count,
+            execution_time_ms=execution_result.execution_time_ms,
+            error_message=execution_result.error
+        )
+
     def _save_audit(self, audit: ExecutionAudit) -> None:
-        """Save audit record to database"""
-        self.audit_store.save_audit(audit)
-        logger.info(f"Audit record saved: {audit.audit_id}")
+        """Queue audit record for background persistence"""
+        self._audit_queue.put(audit)
+        logger.info("Audit record queued: %s", audit.audit_id)
 
     def _audit_denied(
         self,
@@ -610,7 +961,11 @@ class SemanticOrchestrator:
         context: ExecutionContext,
         error: str
     ) -> None:
-        """Save audit record for denied/failed query"""
+        """Save audit record for denied/failed query.
+
+        Denials stay synchronous: they are off the hot path and a failure
+        to persist them must surface to the caller (fail-closed audit).
+        """
         self.audit_store.save_denied(
             audit_id=audit_id,
             question=question,
@@ -620,8 +975,46 @@ class SemanticOrchestrator:
             error=error
         )
 
+    def _audit_drainer(self) -> None:
+        """Background loop draining queued audit writes in batches."""
+        while True:
+            item = self._audit_queue.get()
+            stop = item is None
+            batch = [] if stop else [item]
+            while not stop and len(batch) < self._audit_batch_max:
+                try:
+                    next_item = self._audit_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if next_item is None:
+                    stop = True
+                    break
+                batch.append(next_item)
+
+            try:
+                self.audit_store.save_audit_batch(batch)
+            except Exception:
+                logger.error("Audit batch write failed", exc_info=True)
+            finally:
+                for _ in range(len(batch) + (1 if stop else 0)):
+                    self._audit_queue.task_done()
+
+            if stop:
+                return
+
+    def flush_audits(self) -> None:
+        """Block until all queued audit writes have been persisted."""
+        self._audit_queue.join()
+
+    def close(self) -> None:
+        """Flush pending audit writes and stop background workers."""
+        self._audit_queue.put(None)
+        self._audit_thread.join(timeout=10)
+        self._io_pool.shutdown(wait=False)
+
     def _load_audit(self, audit_id: str) -> Optional[ExecutionAudit]:
-        """Load audit record by ID"""
+        """Load audit record by ID (flushes pending writes first)"""
+        self.flush_audits()
         return self.audit_store.load_audit(audit_id)
 
     # ============================================================
@@ -661,10 +1054,18 @@ class SemanticOrchestrator:
     def rebuild_dependencies(self) -> None:
         """Rebuild metric dependencies from logical definitions."""
         self.dependency_builder.rebuild_all()
+        self.invalidate_plan_cache()
 
     def rebuild_dependencies_for_metric(self, metric_name: str) -> None:
         """Rebuild dependencies for a single metric."""
         self.dependency_builder.rebuild_for_metric(metric_name)
+        self.invalidate_plan_cache()
+
+    def invalidate_plan_cache(self) -> None:
+        """Drop all cached plans after metadata or policy changes."""
+        self._plan_cache.clear()
+        self.grain_validator.invalidate()
+        self.resolver.invalidate()
 
     def detect_dependency_cycles(self) -> List[List[tuple]]:
         """Detect cycles in metric dependencies."""
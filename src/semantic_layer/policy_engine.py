@@ -6,14 +6,18 @@ Implements allow/deny policies based on roles and conditions.
 """
 
 import logging
-from typing import Optional, List, Dict, Any
+from collections import OrderedDict
+from typing import Optional, List, Dict, Any, Tuple
 
-from .models import AccessPolicy, PolicyDeniedError
+from .models import AccessPolicy, PolicyDecision, PolicyDeniedError
 from .interfaces import PolicyStore
 from .sqlite_stores import SQLitePolicyStore
 
 logger = logging.getLogger(__name__)
 
+# Sentinel distinguishing "key absent" from a stored None value
+_MISS = object()
+
 
 class PolicyEngine:
     """
@@ -37,13 +41,19 @@ class PolicyEngine:
             policy_store = SQLitePolicyStore(db_path)
         self.policy_store = policy_store
 
+        # Applicable-policy cache: policies change rarely but are read on
+        # every query, so repeated (object, role, action) lookups skip the
+        # store round-trip. Invalidated on create_policy / invalidate().
+        self._policy_cache: 'OrderedDict[tuple, tuple]' = OrderedDict()
+        self._policy_cache_max = 1024
+
     def check_access(
         self,
         semantic_object_id: int,
         role: str,
         action: str,
         context: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, Any]:
+    ) -> PolicyDecision:
         """
         Check if a user with given role can perform action on semantic object.
 
@@ -54,38 +64,33 @@ class PolicyEngine:
             context: Additional context for conditional policies
 
         Returns:
-            Decision dict with {allow: bool, reason: str, policies: list}
+            PolicyDecision with allow, reason and matched policies
 
         Raises:
             PolicyDeniedError: If access is denied
         """
-        logger.info(f"=== POLICY CHECK ===")
-        logger.info(f"Semantic Object ID: {semantic_object_id}")
-        logger.info(f"Role: {role}")
-        logger.info(f"Action: {action}")
-        logger.info(f"Context: {context}")
+        logger.info("POLICY CHECK - object=%s role=%s action=%s context=%s",
+                    semantic_object_id, role, action, context)
 
-        # Get applicable policies
-        policies = self._get_applicable_policies(semantic_object_id, role, action)
-        logger.info(f"Found {len(policies)} applicable policies")
+        # Get applicable policies, pre-partitioned by effect
+        policies, denies, allows = self._get_policy_bands(semantic_object_id, role, action)
+        logger.info("Found %s applicable policies", len(policies))
 
         if not policies:
             # Default deny: no policies means no access
             logger.warning("No policies found - default deny")
-            decision = {
-                'allow': False,
-                'reason': 'No access policies defined - default deny',
-                'policies': []
-            }
+            decision = PolicyDecision(
+                allow=False,
+                reason='No access policies defined - default deny'
+            )
         else:
-            # Evaluate policies in priority order
-            decision = self._evaluate_policies(policies, context)
+            # Evaluate the deny band first, then the allow band
+            decision = self._evaluate_bands(denies, allows, context)
 
-        logger.info(f"Decision: {'ALLOW' if decision['allow'] else 'DENY'}")
-        logger.info(f"Reason: {decision['reason']}")
+        logger.info("Decision: %s - %s", 'ALLOW' if decision.allow else 'DENY', decision.reason)
 
-        if not decision['allow']:
-            raise PolicyDeniedError(decision['reason'])
+        if not decision.allow:
+            raise PolicyDeniedError(decision.reason)
 
         return decision
 
@@ -94,58 +99,112 @@ class PolicyEngine:
         semantic_object_id: int,
         role: str,
         action: str
-    ) -> List[AccessPolicy]:
+    ) -> Tuple[AccessPolicy, ...]:
         """
         Retrieve policies that match the object/role/action combination.
-        Returns ordered by priority (highest first).
+        Returns an immutable tuple ordered by priority (highest first),
+        shared with the cache — no defensive copy.
+        """
+        return self._get_policy_bands(semantic_object_id, role, action)[0]
+
+    def _get_policy_bands(
+        self,
+        semantic_object_id: int,
+        role: str,
+        action: str
+    ) -> tuple:
+        """
+        Cached (all, denies, allows) policy tuples for the key, each in
+        priority order. Partitioning happens once at fetch time so
+        evaluation never re-scans for effects.
         """
-        return self.policy_store.get_applicable_policies(semantic_object_id, role, action)
+        key = (semantic_object_id, role, action)
+        cached = self._policy_cache.get(key)
+        if cached is not None:
+            self._policy_cache.move_to_end(key)
+            return cached
+
+        policies = self.policy_store.get_applicable_policies(semantic_object_id, role, action)
+        bands = (
+            tuple(policies),
+            tuple(p for p in policies if p._is_deny),
+            tuple(p for p in policies if not p._is_deny),
+        )
+        self._policy_cache[key] = bands
+        if len(self._policy_cache) > self._policy_cache_max:
+            self._policy_cache.popitem(last=False)
+        return bands
+
+    def invalidate(self) -> None:
+        """Drop cached policy lookups after external policy changes."""
+        self._policy_cache.clear()
 
     def _evaluate_policies(
         self,
         policies: List[AccessPolicy],
         context: Optional[Dict[str, Any]]
-    ) -> Dict[str, Any]:
+    ) -> PolicyDecision:
         """
-        Evaluate policies in priority order.
+        Evaluate a mixed policy list: partition by effect, then apply the
+        banded evaluation below.
+        """
+        return self._evaluate_bands(
+            tuple(p for p in policies if p._is_deny),
+            tuple(p for p in policies if not p._is_deny),
+            context
+        )
+
+    def _evaluate_bands(
+        self,
+        denies: tuple,
+        allows: tuple,
+        context: Optional[Dict[str, Any]]
+    ) -> PolicyDecision:
+        """
+        Evaluate pre-partitioned policy bands.
 
         Evaluation rules:
-        1. Process policies from highest to lowest priority
-        2. First matching policy (by condition) wins
-        3. Deny policies take precedence over allow (security principle)
-        4. Explicit deny stops evaluation
-        5. If no policies match, default deny
-        """
-        matched_policies = []
-
-        for policy in policies:
-            # Check if policy conditions match context
-            if self._matches_condition(policy, context):
-                logger.debug(f"Policy matched: {policy.id} (effect={policy.effect})")
-                matched_policies.append(policy)
-
-                # Explicit deny stops evaluation
-                if policy.effect == 'deny':
-                    return {
-                        'allow': False,
-                        'reason': f'Denied by policy {policy.id}: {policy.condition}',
-                        'policies': matched_policies
-                    }
-
-        # If we have matching allow policies, allow access
-        if matched_policies and all(p.effect == 'allow' for p in matched_policies):
-            return {
-                'allow': True,
-                'reason': f'Allowed by {len(matched_policies)} policy(ies)',
-                'policies': matched_policies
-            }
+        1. Deny policies take precedence over allow (security principle):
+           any matching deny stops evaluation
+        2. Otherwise the first matching allow (highest priority) wins
+        3. If no policies match, default deny
+        """
+        # Condition matching inlined: the context lookup is bound once for
+        # the whole evaluation instead of re-checked per policy.
+        ctx_get = context.get if context else None
+
+        for policy in denies:
+            items = policy._cond_items
+            if items is not None:
+                if ctx_get is None or not all(ctx_get(k, _MISS) == v for k, v in items):
+                    continue
+            logger.debug("Policy matched: %s (effect=deny)", policy.id)
+            return PolicyDecision(
+                allow=False,
+                reason=f'Denied by policy {policy.id}: {policy.condition}',
+                policies=(policy,)
+            )
+
+        for policy in allows:
+            items = policy._cond_items
+            if items is not None:
+                if ctx_get is None or not all(ctx_get(k, _MISS) == v for k, v in items):
+                    continue
+            logger.debug("Policy matched: %s (effect=allow)", policy.id)
+            # Early exit on the first (highest-priority) matching allow;
+            # the reason names that policy rather than claiming a count
+            # of matches the evaluation never computed.
+            return PolicyDecision(
+                allow=True,
+                reason=f'Allowed by policy {policy.id}: {policy.condition}',
+                policies=(policy,)
+            )
 
         # Default deny
-        return {
-            'allow': False,
-            'reason': 'No matching allow policy found - default deny',
-            'policies': matched_policies
-        }
+        return PolicyDecision(
+            allow=False,
+            reason='No matching allow policy found - default deny'
+        )
 
     def _matches_condition(self, policy: AccessPolicy, context: Optional[Dict[str, Any]]) -> bool:
         """
@@ -154,22 +213,21 @@ class PolicyEngine:
         For POC, implements simple key-value matching.
         In production, would support complex expressions (e.g., CEL, JMESPath).
         """
-        if not policy.condition:
-            # No condition means policy always matches
-            return True
+        # Precompiled pairs from AccessPolicy; plain objects fall back to
+        # the condition dict itself
+        items = getattr(policy, '_cond_items', None)
+        if items is None:
+            if not policy.condition:
+                # No condition means policy always matches
+                return True
+            items = tuple(policy.condition.items())
 
         if not context:
             # Policy has condition but no context provided
             return False
 
-        # Check all key-value pairs in condition
-        for key, expected_value in policy.condition.items():
-            if key not in context:
-                return False
-            if context[key] != expected_value:
-                return False
-
-        return True
+        get = context.get
+        return all(get(key, _MISS) == expected for key, expected in items)
 
     def get_user_policies(self, role: str) -> List[Dict[str, Any]]:
         """
@@ -206,7 +264,7 @@ class PolicyEngine:
         Returns:
             ID of created policy
         """
-        return self.policy_store.create_policy(
+        policy_id = self.policy_store.create_policy(
             semantic_object_id=semantic_object_id,
             role=role,
             action=action,
@@ -214,3 +272,20 @@ class PolicyEngine:
             condition=condition,
             priority=priority
         )
+        self.invalidate()
+        return policy_id
+
+    def create_policies(self, policies: List[Dict[str, Any]]) -> int:
+        """
+        Create many access policies in one store transaction.
+
+        Args:
+            policies: Dicts with the create_policy keyword arguments
+
+        Returns:
+            Number of policies created
+        """
+        created = self.policy_store.create_policies_bulk(policies)
+        # One cache invalidation for the whole batch, not per row
+        self.invalidate()
+        return created
@@ -10,10 +10,12 @@ from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
 from datetime import datetime
 
+from .models import AmbiguityError
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ScenarioMatchResult:
     """Result of scenario matching for a single version."""
     version_id: int
@@ -82,6 +84,56 @@ class ScenarioMatcher:
             matches_scenario=matches_scenario
         )
 
+    def evaluate_versions(
+        self,
+        versions: List,
+        scenario: Optional[Dict[str, Any]],
+        timestamp: Optional[datetime]
+    ) -> List[ScenarioMatchResult]:
+        """
+        Evaluate all versions in one pass.
+
+        Hoists the shared work out of the per-version loop: the timestamp
+        default is resolved once and the scenario's item view is built
+        once, so each version only does its own comparisons.
+        """
+        ts = timestamp or datetime.now()
+        scenario_items = scenario.items() if scenario else None
+
+        results = []
+        for version in versions:
+            is_time_effective = version.is_effective(ts)
+
+            cond_items = version._cond_items
+            if cond_items is None:
+                # No condition means this is the default version
+                matches_scenario = True
+            elif scenario_items is None:
+                matches_scenario = False
+            elif isinstance(cond_items, frozenset):
+                matches_scenario = cond_items <= scenario_items
+            else:
+                # Conditions with unhashable values keep plain item
+                # tuples; compare per key (see SemanticVersion)
+                matches_scenario = version.matches_scenario(scenario)
+
+            score, reason = self._calculate_score(
+                version.version_name,
+                version.scenario_condition,
+                scenario,
+                is_time_effective,
+                matches_scenario
+            )
+            results.append(ScenarioMatchResult(
+                version_id=version.id,
+                version_name=version.version_name,
+                score=score,
+                reason=reason,
+                is_time_effective=is_time_effective,
+                matches_scenario=matches_scenario
+            ))
+        return results
+
     def _calculate_score(
         self,
         version_name: str,
@@ -149,56 +201,40 @@ class ScenarioMatcher:
         if not match_results:
             raise ValueError("No versions to select from")
 
-        # Group by score
-        score_groups = {}
+        # Single-pass argmax over (score, priority): track the current
+        # best and the results tied with it, instead of grouping by score
+        # and re-scanning the top group for priority ties.
+        get_priority = versions_with_priority.get
+        selected = None
+        best_score = -1
+        best_priority = 0
+        tied: List[ScenarioMatchResult] = []
+
         for result in match_results:
-            if result.score not in score_groups:
-                score_groups[result.score] = []
-            score_groups[result.score].append(result)
-
-        # Get highest score
-        max_score = max(score_groups.keys())
-        best_candidates = score_groups[max_score]
-
-        # If only one candidate, return it
-        if len(best_candidates) == 1:
-            selected = best_candidates[0]
-            logger.info(f"✓ Single best version: {selected.version_name}")
+            priority = get_priority(result.version_id, 0)
+            if selected is None or (result.score, priority) > (best_score, best_priority):
+                selected = result
+                best_score = result.score
+                best_priority = priority
+                tied = [result]
+            elif result.score == best_score and priority == best_priority:
+                tied.append(result)
+
+        if len(tied) == 1:
+            logger.info("✓ Selected version: %s (score=%s, priority=%s)",
+                        selected.version_name, best_score, best_priority)
             return selected
 
-        # Multiple candidates with same score → use priority or raise ambiguity
-        logger.warning(f"Multiple versions with score={max_score}: {[r.version_name for r in best_candidates]}")
-
-        # Sort by priority (higher is better)
-        prioritized = sorted(
-            best_candidates,
-            key=lambda r: versions_with_priority.get(r.version_id, 0),
-            reverse=True
-        )
-
-        # Check if top priorities are unique
-        top_priority = versions_with_priority.get(prioritized[0].version_id, 0)
-        top_priority_count = sum(
-            1 for r in prioritized
-            if versions_with_priority.get(r.version_id, 0) == top_priority
+        # Ambiguity: several versions share the best score and priority
+        raise AmbiguityError(
+            candidates=[
+                {"id": r.version_id, "name": r.version_name, "priority": best_priority}
+                for r in tied
+            ],
+            message=f"Multiple versions have score={best_score} and priority={best_priority}. "
+                   f"Please clarify which version to use."
         )
 
-        if top_priority_count == 1:
-            selected = prioritized[0]
-            logger.info(f"✓ Selected by priority: {selected.version_name} (priority={top_priority})")
-            return selected
-        else:
-            # Ambiguity remains
-            from .models import AmbiguityError
-            raise AmbiguityError(
-                candidates=[
-                    {"id": r.version_id, "name": r.version_name, "priority": versions_with_priority.get(r.version_id, 0)}
-                    for r in prioritized
-                ],
-                message=f"Multiple versions have score={max_score} and priority={top_priority}. "
-                       f"Please clarify which version to use."
-            )
-
     def log_evaluation_results(
         self,
         match_results: List[ScenarioMatchResult],
@@ -207,21 +243,16 @@ class ScenarioMatcher:
         """
         Log detailed evaluation results for explainability.
         """
-        logger.info("=" * 80)
-        logger.info("SCENARIO MATCH EVALUATION RESULTS")
-        logger.info("=" * 80)
+        if not logger.isEnabledFor(logging.INFO):
+            return
 
+        logger.info("SCENARIO MATCH EVALUATION RESULTS")
         for result in match_results:
             status = "✓" if result == selected else "✗"
             logger.info(
-                f"{status} {result.version_name}: "
-                f"score={result.score} reason={result.reason} "
-                f"(time_effective={result.is_time_effective}, "
-                f"scenario_match={result.matches_scenario})"
+                "%s %s: score=%s reason=%s (time_effective=%s, scenario_match=%s)",
+                status, result.version_name, result.score, result.reason,
+                result.is_time_effective, result.matches_scenario
             )
-
-        logger.info("-" * 80)
-        logger.info(f"Selected version: {selected.version_name}")
-        logger.info(f"  Score: {selected.score}")
-        logger.info(f"  Reason: {selected.reason}")
-        logger.info("=" * 80)
+        logger.info("Selected version: %s (score=%s, reason=%s)",
+                    selected.version_name, selected.score, selected.reason)
@@ -6,6 +6,9 @@ This is the bridge between human language and semantic layer metadata.
 """
 
 import logging
+import re
+import sys
+from collections import OrderedDict
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
@@ -18,6 +21,44 @@ from .sqlite_stores import SQLiteMetadataStore
 
 logger = logging.getLogger(__name__)
 
+# Known Chinese phrases and their English equivalents, compiled once at
+# import into a lookup dict. _extract_keywords scans the question in a
+# single pass, probing this dict with each distinct phrase length per
+# position (multi-pattern matching in the Aho-Corasick spirit) instead of
+# one substring search per phrase.
+_KNOWN_PHRASES: Dict[str, str] = {
+    # FPY - First Pass Yield
+    '一次合格率': 'FPY',
+    '直通率': 'FPY',
+    '良率': 'FPY',
+    '合格率': 'FPY',
+    # Output
+    '产量': 'Output',
+    '产出数量': 'Output',
+    '生产量': 'Output',
+    # Defect Rate
+    '不良率': 'Defect',
+    '次品率': 'Defect',
+    '缺陷率': 'Defect',
+    # Gross Margin - 毛利率 (PPT Demo Scenario)
+    '毛利率': 'GrossMargin',
+    '毛利': 'GrossMargin',
+    '利润率': 'GrossMargin',
+    # Order metrics
+    '订单数': 'OrderCount',
+    '订单量': 'OrderCount',
+    # Click Rate
+    '点击率': 'ClickRate',
+    'CTR': 'ClickRate',
+}
+_PHRASE_MAP: Dict[str, str] = {
+    sys.intern(phrase): sys.intern(equiv) for phrase, equiv in _KNOWN_PHRASES.items()
+}
+_PHRASE_LENGTHS = tuple(sorted({len(p) for p in _PHRASE_MAP}, reverse=True))
+
+_ENGLISH_WORD_RE = re.compile(r'\b[a-zA-Z]{2,}\b')
+_CHINESE_WORD_RE = re.compile(r'[\u4e00-\u9fff]{3,}')
+
 
 class SemanticResolver:
     """
@@ -40,6 +81,27 @@ class SemanticResolver:
             metadata_store = SQLiteMetadataStore(db_path)
         self.metadata_store = metadata_store
 
+        # Resolution cache: normalized question -> (object id, objects
+        # version at resolution time). Repeated questions skip keyword
+        # extraction and candidate scoring; hits are validated against
+        # the store's current version marker so metadata edits — e.g. a
+        # new object that would make the question ambiguous — force a
+        # fresh resolution instead of silently returning the old match.
+        self._resolution_cache: 'OrderedDict[str, tuple]' = OrderedDict()
+        self._resolution_cache_max = 512
+
+        # Inverted search index (built lazily): exact term and character
+        # posting lists over active objects, so candidate generation does
+        # not score every object against every keyword. Guarded by the
+        # store's objects version so external metadata edits are seen
+        # without re-listing objects on every resolution.
+        self._search_index: Optional[tuple] = None
+        self._objects_version: Any = None
+
+        # Logical definitions fetched alongside versions in resolve_version,
+        # so resolve_logic needs no second round-trip.
+        self._logic_by_version_id: Dict[int, LogicalDefinition] = {}
+
     # ============================================================
     # RESOLUTION STEPS
     # ============================================================
@@ -57,31 +119,51 @@ class SemanticResolver:
         Raises:
             AmbiguityError: If multiple objects match
         """
-        logger.info(f"=== STEP 1: RESOLVE SEMANTIC OBJECT ===")
-        logger.info(f"Question: {question}")
+        logger.info("STEP 1: RESOLVE SEMANTIC OBJECT - question=%s", question)
+
+        normalized = ' '.join(question.strip().lower().split())
+        cached = self._resolution_cache.get(normalized)
+        if cached is not None:
+            cached_id, cached_version = cached
+            if cached_version == self._get_objects_version():
+                cached_obj = self.metadata_store.get_semantic_object_by_id(cached_id)
+                if cached_obj is not None and cached_obj.status == 'active':
+                    self._resolution_cache.move_to_end(normalized)
+                    logger.info("✓ Resolution cache hit: %s (ID: %s)", cached_obj.name, cached_obj.id)
+                    return cached_obj
+            # Objects changed since this entry was cached (or the object
+            # was deactivated); resolve fresh so new ambiguity surfaces
+            del self._resolution_cache[normalized]
 
         # Extract keywords from question
         keywords = self._extract_keywords(question)
-        logger.info(f"Extracted keywords: {keywords}")
+        logger.info("Extracted keywords: %s", keywords)
 
         # Search for matching semantic objects
         candidates = self._search_semantic_objects(keywords)
-        logger.info(f"Found {len(candidates)} candidate(s)")
+        logger.info("Found %s candidate(s)", len(candidates))
 
         if not candidates:
-            logger.warning(f"No semantic object matched keywords: {keywords}")
+            logger.warning("No semantic object matched keywords: %s", keywords)
             raise ValueError(f"No semantic object found for: {question}")
 
         if len(candidates) > 1:
             # Ambiguity detected - don't guess, ask for clarification
-            logger.warning(f"Ambiguity detected: {len(candidates)} matches")
+            logger.warning("Ambiguity detected: %s matches", len(candidates))
             raise AmbiguityError(
                 candidates=[{"id": c.id, "name": c.name, "domain": c.domain} for c in candidates],
                 message=f"Multiple semantic objects matched: {', '.join(c.name for c in candidates)}. Please clarify."
             )
 
         semantic_obj = candidates[0]
-        logger.info(f"✓ Matched semantic object: {semantic_obj.name} (ID: {semantic_obj.id})")
+        logger.info("✓ Matched semantic object: %s (ID: %s)", semantic_obj.name, semantic_obj.id)
+
+        # _objects_version was refreshed by the search-index lookup above,
+        # so it reflects the store state this resolution was computed from
+        self._resolution_cache[normalized] = (semantic_obj.id, self._objects_version)
+        if len(self._resolution_cache) > self._resolution_cache_max:
+            self._resolution_cache.popitem(last=False)
+
         return semantic_obj
 
     def resolve_version(
@@ -107,37 +189,35 @@ class SemanticResolver:
             VersionNotFoundError: If no active version found
             AmbiguityError: If multiple versions match with same score and priority
         """
-        logger.info(f"=== STEP 2: RESOLVE SEMANTIC VERSION ===")
-        logger.info(f"Semantic Object ID: {semantic_object_id}")
-        logger.info(f"Scenario: {scenario}")
-        logger.info(f"Timestamp: {timestamp}")
-
-        versions = self._get_versions_for_object(semantic_object_id)
-        logger.info(f"Found {len(versions)} version(s)")
+        logger.info("STEP 2: RESOLVE SEMANTIC VERSION - object=%s scenario=%s timestamp=%s",
+                    semantic_object_id, scenario, timestamp)
+
+        # One round-trip: versions joined with their logical definitions,
+        # pre-populating the cache resolve_logic reads from
+        pairs = self._get_versions_with_logic(semantic_object_id)
+        versions = [version for version, _ in pairs]
+        for version, logic in pairs:
+            if logic is not None:
+                self._logic_by_version_id[version.id] = logic
+        logger.info("Found %s version(s)", len(versions))
 
         if not versions:
             raise VersionNotFoundError(
                 f"No versions found for semantic_object_id={semantic_object_id}"
             )
 
-        # Get version priorities from SemanticVersion objects
-        version_priorities = {v.id: v.priority for v in versions}
+        # Index versions by id once; priorities and the post-selection
+        # lookup both come from it
+        versions_by_id = {v.id: v for v in versions}
+        version_priorities = {vid: v.priority for vid, v in versions_by_id.items()}
 
         # Import ScenarioMatcher
         from .scenario_matcher import ScenarioMatcher
 
         matcher = ScenarioMatcher()
 
-        # Evaluate all versions
-        match_results = []
-        for version in versions:
-            result = matcher.evaluate_version(
-                version=version,
-                scenario=scenario,
-                timestamp=timestamp,
-                priority=version_priorities.get(version.id, 0)
-            )
-            match_results.append(result)
+        # Evaluate all versions in one pass
+        match_results = matcher.evaluate_versions(versions, scenario, timestamp)
 
         # Select best version
         selected_result = matcher.select_best_version(match_results, version_priorities)
@@ -146,10 +226,10 @@ class SemanticResolver:
         matcher.log_evaluation_results(match_results, selected_result)
 
         # Get the actual version object
-        selected = next(v for v in versions if v.id == selected_result.version_id)
+        selected = versions_by_id[selected_result.version_id]
 
-        logger.info(f"✓ Selected version: {selected.version_name} (ID: {selected.id})")
-        logger.info(f"  Description: {selected.description}")
+        logger.info("✓ Selected version: %s (ID: %s) - %s",
+                    selected.version_name, selected.id, selected.description)
 
         return selected
 
@@ -163,19 +243,19 @@ class SemanticResolver:
         Returns:
             LogicalDefinition containing business formula
         """
-        logger.info(f"=== STEP 3: RESOLVE LOGICAL DEFINITION ===")
-        logger.info(f"Semantic Version ID: {semantic_version_id}")
+        logger.info("STEP 3: RESOLVE LOGICAL DEFINITION - version=%s", semantic_version_id)
 
-        logical_def = self._get_logical_definition(semantic_version_id)
+        logical_def = self._logic_by_version_id.get(semantic_version_id)
+        if logical_def is None:
+            logical_def = self._get_logical_definition(semantic_version_id)
 
         if not logical_def:
             raise ValueError(
                 f"No logical definition found for semantic_version_id={semantic_version_id}"
             )
 
-        logger.info(f"✓ Resolved logic: {logical_def.expression}")
-        logger.info(f"  Grain: {logical_def.grain}")
-        logger.info(f"  Variables: {logical_def.variables}")
+        logger.info("✓ Resolved logic: %s (grain=%s, variables=%s)",
+                    logical_def.expression, logical_def.grain, logical_def.variables)
 
         return logical_def
 
@@ -188,47 +268,25 @@ class SemanticResolver:
         Extract potential semantic keywords from question.
         For POC, use known phrase matching.
         """
-        import re
-
-        # Known Chinese phrases and their English equivalents
-        # Format: (chinese_phrase, english_equivalent)
-        known_phrases = [
-            # FPY - First Pass Yield
-            ('一次合格率', 'FPY'),
-            ('直通率', 'FPY'),
-            ('良率', 'FPY'),
-            ('合格率', 'FPY'),
-            # Output
-            ('产量', 'Output'),
-            ('产出数量', 'Output'),
-            ('生产量', 'Output'),
-            # Defect Rate
-            ('不良率', 'Defect'),
-            ('次品率', 'Defect'),
-            ('缺陷率', 'Defect'),
-            # Gross Margin - 毛利率 (PPT Demo Scenario)
-            ('毛利率', 'GrossMargin'),
-            ('毛利', 'GrossMargin'),
-            ('利润率', 'GrossMargin'),
-            # Order metrics
-            ('订单数', 'OrderCount'),
-            ('订单量', 'OrderCount'),
-            # Click Rate
-            ('点击率', 'ClickRate'),
-            ('CTR', 'ClickRate'),
-        ]
-
         keywords = []
 
-        # Check if any known phrase appears in the question
-        for chinese_phrase, english_equiv in known_phrases:
-            if chinese_phrase in question:
-                keywords.append(chinese_phrase)
-                keywords.append(english_equiv)
+        # Single scan over the question: at each position probe the phrase
+        # dict with every distinct phrase length, so overlapping phrases
+        # (e.g. '一次合格率' also contains '合格率') are still all reported.
+        phrase_map = _PHRASE_MAP
+        seen_phrases = set()
+        for i in range(len(question)):
+            for length in _PHRASE_LENGTHS:
+                candidate = question[i:i + length]
+                english_equiv = phrase_map.get(candidate)
+                if english_equiv is not None and candidate not in seen_phrases:
+                    seen_phrases.add(candidate)
+                    keywords.append(candidate)
+                    keywords.append(english_equiv)
 
         # Also extract standalone English words
-        english_words = re.findall(r'\b[a-zA-Z]{2,}\b', question.lower())
-        keywords.extend(english_words)
+        lowered = question.lower()
+        keywords.extend(_ENGLISH_WORD_RE.findall(lowered))
 
         # Term dictionary normalization (lightweight)
         try:
@@ -242,8 +300,7 @@ class SemanticResolver:
 
         # If nothing found, try to extract any Chinese words (3+ chars)
         if not keywords:
-            chinese_words = re.findall(r'[\u4e00-\u9fff]{3,}', question)
-            keywords.extend(chinese_words)
+            keywords.extend(_CHINESE_WORD_RE.findall(question))
 
         # Remove duplicates while preserving order
         seen = set()
@@ -261,42 +318,121 @@ class SemanticResolver:
 
         Returns list ordered by relevance.
         """
+        # Lowercase the keywords once, not per candidate object
+        lowered_keywords = [keyword.lower() for keyword in keywords]
+
+        by_id, exact_postings, char_postings = self._get_search_index()
+
+        # Union postings per keyword instead of scoring every object.
+        # Exact name/alias hits come straight from the term postings; for
+        # partial matches the character postings give a superset (an
+        # object can only contain the keyword if it contains all of its
+        # characters), which exact scoring below then narrows.
+        candidate_ids = set()
+        for keyword in lowered_keywords:
+            hit = exact_postings.get(keyword)
+            if hit:
+                candidate_ids |= hit
+
+            possible = None
+            for ch in set(keyword):
+                ids = char_postings.get(ch)
+                if not ids:
+                    possible = None
+                    break
+                possible = ids if possible is None else possible & ids
+                if not possible:
+                    possible = None
+                    break
+            if possible:
+                candidate_ids |= possible
+
         candidates = []
-        for obj in self.metadata_store.list_active_semantic_objects():
-            score = self._calculate_relevance(obj, keywords)
+        for obj_id in candidate_ids:
+            obj = by_id[obj_id]
+            score = self._relevance_lowered(obj, lowered_keywords)
             if score > 0:
                 candidates.append((score, obj))
 
-        # Sort by relevance (descending) and return objects
-        candidates.sort(key=lambda x: x[0], reverse=True)
+        # Sort by relevance (descending) and return objects; break score
+        # ties by store order so results stay deterministic
+        candidates.sort(key=lambda x: (-x[0], x[1].id))
         return [obj for score, obj in candidates]
 
+    def _get_search_index(self) -> tuple:
+        """
+        Build (lazily) the inverted index over active semantic objects,
+        refreshing it when the store's objects version changes.
+        """
+        version = self._get_objects_version()
+        if self._search_index is None or version != self._objects_version:
+            by_id: Dict[int, SemanticObject] = {}
+            exact_postings: Dict[str, set] = {}
+            char_postings: Dict[str, set] = {}
+            for obj in self.metadata_store.list_active_semantic_objects():
+                by_id[obj.id] = obj
+                for term in obj._alias_set:
+                    exact_postings.setdefault(term, set()).add(obj.id)
+                chars = set(obj._name_lower) | set(obj._desc_lower)
+                for alias in obj._aliases_lower:
+                    chars.update(alias)
+                for ch in chars:
+                    char_postings.setdefault(ch, set()).add(obj.id)
+            self._search_index = (by_id, exact_postings, char_postings)
+            self._objects_version = version
+        return self._search_index
+
+    def _get_objects_version(self) -> Any:
+        """Current store version marker; None for stores without one."""
+        get_version = getattr(self.metadata_store, 'get_objects_version', None)
+        if get_version is None:
+            return None
+        return get_version()
+
+    def invalidate(self) -> None:
+        """Drop cached resolutions and the search index after metadata changes."""
+        self._resolution_cache.clear()
+        self._search_index = None
+        self._logic_by_version_id.clear()
+
     def _calculate_relevance(self, obj: SemanticObject, keywords: List[str]) -> int:
         """
         Calculate relevance score for a semantic object against keywords.
         Higher score = better match.
         """
+        return self._relevance_lowered(obj, [keyword.lower() for keyword in keywords])
+
+    @staticmethod
+    def _relevance_lowered(obj: SemanticObject, lowered_keywords: List[str]) -> int:
+        """
+        Score against pre-lowercased keywords using the lowercased forms
+        cached on SemanticObject — no .lower() in the inner loop.
+        """
         score = 0
+        name_lower = obj._name_lower
+        desc_lower = obj._desc_lower
+        aliases_lower = obj._aliases_lower
+        aliases_set = obj._aliases_set
 
-        for keyword in keywords:
+        for keyword in lowered_keywords:
             # Exact match on name (highest score)
-            if keyword.lower() == obj.name.lower():
+            if keyword == name_lower:
                 score += 10
 
-            # Match in aliases
-            if any(keyword.lower() == alias.lower() for alias in obj.aliases):
+            # Match in aliases (hash lookup, not a linear scan)
+            if keyword in aliases_set:
                 score += 8
 
             # Partial match in name
-            if keyword.lower() in obj.name.lower():
+            if keyword in name_lower:
                 score += 3
 
             # Partial match in description
-            if keyword.lower() in obj.description.lower():
+            if keyword in desc_lower:
                 score += 1
 
             # Partial match in aliases
-            if any(keyword.lower() in alias.lower() for alias in obj.aliases):
+            if any(keyword in alias for alias in aliases_lower):
                 score += 2
 
         return score
@@ -305,6 +441,18 @@ class SemanticResolver:
         """Get all versions for a semantic object"""
         return self.metadata_store.get_versions_for_object(semantic_object_id)
 
+    def _get_versions_with_logic(self, semantic_object_id: int) -> List[tuple]:
+        """
+        Get (version, logical definition) pairs, batched where the store
+        supports it; otherwise versions only with definitions left to
+        resolve_logic's fallback lookup.
+        """
+        get_batched = getattr(self.metadata_store, 'get_versions_with_logic', None)
+        if get_batched is not None:
+            return get_batched(semantic_object_id)
+        versions = self.metadata_store.get_versions_for_object(semantic_object_id)
+        return [(version, None) for version in versions]
+
     def _get_logical_definition(self, semantic_version_id: int) -> Optional[LogicalDefinition]:
         """Get logical definition for a semantic version"""
         return self.metadata_store.get_logical_definition(semantic_version_id)
@@ -4,7 +4,9 @@ SQLite implementations for storage and execution interfaces.
 
 import json
 import sqlite3
-from typing import Optional, List, Dict, Any
+import threading
+from collections import OrderedDict
+from typing import Optional, List, Dict, Any, Tuple
 
 from .models import (
     SemanticObject,
@@ -21,89 +23,245 @@ from .models import (
     MetricEntityMap,
     MetricDependency,
     TermDictionary,
+    GraphSnapshot,
+    json_dumps,
 )
 
+# Per-thread connection cache keyed by (database path, readonly). Stores
+# used to open and close a connection around every call, paying connect +
+# statement re-prepare costs each time; a cached connection reuses
+# SQLite's built-in statement cache instead. Thread-local keeps the
+# default check_same_thread safety (the audit drainer gets its own
+# connection). Read paths ask for readonly handles so, under WAL, readers
+# never queue behind the writer lock.
+_thread_conns = threading.local()
+_THREAD_CONN_MAX = 8
+
+# Statement texts that used to be built by concatenation. Fixed literals
+# keep each variant a single entry in the connection's prepared-statement
+# cache (cached_statements) instead of two near-duplicates.
+_SQL_PHYSMAP_ALL = """
+    SELECT id, logical_definition_id, engine_type, connection_ref,
+           sql_template, params_schema, priority, description, created_at
+    FROM physical_mapping
+    WHERE logical_definition_id = ?
+    ORDER BY priority DESC
+"""
+_SQL_PHYSMAP_BY_ENGINE = """
+    SELECT id, logical_definition_id, engine_type, connection_ref,
+           sql_template, params_schema, priority, description, created_at
+    FROM physical_mapping
+    WHERE logical_definition_id = ? AND engine_type = ?
+    ORDER BY priority DESC
+"""
+
+_SQL_HISTORY_ALL = """
+    SELECT audit_id, question, semantic_object_name, user_role,
+           executed_at, status, row_count
+    FROM execution_audit
+    ORDER BY executed_at DESC LIMIT ?
+"""
+_SQL_HISTORY_BY_USER = """
+    SELECT audit_id, question, semantic_object_name, user_role,
+           executed_at, status, row_count
+    FROM execution_audit
+    WHERE user_id = ?
+    ORDER BY executed_at DESC LIMIT ?
+"""
+# Keyset variants: the executed_at bound turns deep pagination into an
+# index range scan that stops after LIMIT rows, instead of walking the
+# whole history to skip an OFFSET.
+_SQL_HISTORY_ALL_BEFORE = """
+    SELECT audit_id, question, semantic_object_name, user_role,
+           executed_at, status, row_count
+    FROM execution_audit
+    WHERE executed_at < ?
+    ORDER BY executed_at DESC LIMIT ?
+"""
+_SQL_HISTORY_BY_USER_BEFORE = """
+    SELECT audit_id, question, semantic_object_name, user_role,
+           executed_at, status, row_count
+    FROM execution_audit
+    WHERE user_id = ? AND executed_at < ?
+    ORDER BY executed_at DESC LIMIT ?
+"""
+
+
+def _get_connection(db_path: str, readonly: bool = False) -> sqlite3.Connection:
+    """Return the calling thread's cached connection for db_path."""
+    conns = getattr(_thread_conns, 'conns', None)
+    if conns is None:
+        conns = _thread_conns.conns = OrderedDict()
+
+    key = (db_path, readonly)
+    conn = conns.get(key)
+    if conn is None:
+        conn = _open_connection(db_path, readonly)
+        conns[key] = conn
+        if len(conns) > _THREAD_CONN_MAX:
+            _, evicted = conns.popitem(last=False)
+            evicted.close()
+    else:
+        conns.move_to_end(key)
+    return conn
+
+
+def _open_connection(db_path: str, readonly: bool) -> sqlite3.Connection:
+    # Paths may already be SQLite URIs (e.g. the in-memory shared-cache
+    # databases the test suite uses); open those verbatim
+    is_uri = db_path.startswith('file:')
+    if readonly:
+        try:
+            if is_uri:
+                conn = sqlite3.connect(db_path, uri=True, cached_statements=256)
+            else:
+                conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True,
+                                       cached_statements=256)
+        except sqlite3.OperationalError:
+            # Path not openable read-only (e.g. not a plain file path);
+            # fall back to a private read-write handle
+            conn = sqlite3.connect(db_path, uri=is_uri, cached_statements=256)
+        conn.row_factory = sqlite3.Row
+        try:
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-64000")
+            conn.execute("PRAGMA mmap_size=268435456")
+        except sqlite3.DatabaseError:
+            pass
+        return conn
+
+    conn = sqlite3.connect(db_path, uri=is_uri, cached_statements=256)
+    conn.row_factory = sqlite3.Row
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-64000")
+        conn.execute("PRAGMA mmap_size=268435456")
+    except sqlite3.DatabaseError:
+        # Read-only or otherwise restricted database; run with defaults
+        pass
+    return conn
+
 
 class SQLiteMetadataStore:
     def __init__(self, db_path: str):
         self.db_path = db_path
 
     def list_active_semantic_objects(self) -> List[SemanticObject]:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-
-        cursor.execute("""
+        conn = _get_connection(self.db_path, readonly=True)
+        cursor = conn.execute("""
             SELECT id, name, description, aliases, domain, status, created_at, updated_at
             FROM semantic_object
             WHERE status = 'active'
         """)
-        objects = [SemanticObject.from_db_row(tuple(row)) for row in cursor.fetchall()]
-        conn.close()
+        objects = SemanticObject.from_db_rows(cursor)
         return objects
 
-    def get_semantic_object_by_id(self, obj_id: int) -> Optional[SemanticObject]:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+    def get_objects_version(self) -> Any:
+        """
+        Cheap change marker for the semantic_object table. Callers compare
+        successive values to decide whether cached object lists/indexes
+        are still fresh.
+        """
+        conn = _get_connection(self.db_path, readonly=True)
+        cursor = conn.execute("SELECT COUNT(*), MAX(updated_at) FROM semantic_object")
+        row = cursor.fetchone()
+        return (row[0], row[1])
 
-        cursor.execute("""
+    def get_semantic_object_by_id(self, obj_id: int) -> Optional[SemanticObject]:
+        conn = _get_connection(self.db_path, readonly=True)
+        cursor = conn.execute("""
             SELECT id, name, description, aliases, domain, status, created_at, updated_at
             FROM semantic_object
             WHERE id = ?
         """, (obj_id,))
         row = cursor.fetchone()
-        conn.close()
         if row:
-            return SemanticObject.from_db_row(tuple(row))
+            return SemanticObject.from_db_row(row)
         return None
 
     def get_semantic_object_by_name(self, name: str) -> Optional[SemanticObject]:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-
-        cursor.execute("""
+        conn = _get_connection(self.db_path, readonly=True)
+        cursor = conn.execute("""
             SELECT id, name, description, aliases, domain, status, created_at, updated_at
             FROM semantic_object
             WHERE name = ?
         """, (name,))
         row = cursor.fetchone()
-        conn.close()
         if row:
-            return SemanticObject.from_db_row(tuple(row))
+            return SemanticObject.from_db_row(row)
         return None
 
     def get_versions_for_object(self, semantic_object_id: int) -> List[SemanticVersion]:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-
-        cursor.execute("""
+        conn = _get_connection(self.db_path, readonly=True)
+        cursor = conn.execute("""
             SELECT id, semantic_object_id, version_name, effective_from, effective_to,
                    scenario_condition, is_active, priority, description, created_at
             FROM semantic_version
             WHERE semantic_object_id = ?
             ORDER BY effective_from DESC
         """, (semantic_object_id,))
-        versions = [SemanticVersion.from_db_row(tuple(row)) for row in cursor.fetchall()]
-        conn.close()
+        versions = SemanticVersion.from_db_rows(cursor)
         return versions
 
-    def get_logical_definition(self, semantic_version_id: int) -> Optional[LogicalDefinition]:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+    def get_versions_with_logic(
+        self,
+        semantic_object_id: int
+    ) -> List[tuple]:
+        """
+        Fetch versions and their logical definitions in one round-trip.
 
-        cursor.execute("""
+        Returns (SemanticVersion, Optional[LogicalDefinition]) pairs in
+        the same order as get_versions_for_object.
+        """
+        conn = _get_connection(self.db_path, readonly=True)
+        cursor = conn.execute("""
+            SELECT sv.id, sv.semantic_object_id, sv.version_name, sv.effective_from,
+                   sv.effective_to, sv.scenario_condition, sv.is_active, sv.priority,
+                   sv.description, sv.created_at,
+                   ld.id, ld.semantic_version_id, ld.expression, ld.grain,
+                   ld.description, ld.variables, ld.created_at
+            FROM semantic_version sv
+            LEFT JOIN logical_definition ld ON ld.semantic_version_id = sv.id
+            WHERE sv.semantic_object_id = ?
+            ORDER BY sv.effective_from DESC
+        """, (semantic_object_id,))
+        pairs = []
+        for row in cursor.fetchall():
+            version = SemanticVersion.from_db_row(row[:10])
+            logic = LogicalDefinition.from_db_row(row[10:]) if row[10] is not None else None
+            pairs.append((version, logic))
+        return pairs
+
+    def get_version_by_name(
+        self,
+        semantic_object_id: int,
+        version_name: str
+    ) -> Optional[SemanticVersion]:
+        conn = _get_connection(self.db_path, readonly=True)
+        cursor = conn.execute("""
+            SELECT id, semantic_object_id, version_name, effective_from, effective_to,
+                   scenario_condition, is_active, priority, description, created_at
+            FROM semantic_version
+            WHERE semantic_object_id = ? AND version_name = ?
+            LIMIT 1
+        """, (semantic_object_id, version_name))
+        row = cursor.fetchone()
+        if row:
+            return SemanticVersion.from_db_row(row)
+        return None
+
+    def get_logical_definition(self, semantic_version_id: int) -> Optional[LogicalDefinition]:
+        conn = _get_connection(self.db_path, readonly=True)
+        cursor = conn.execute("""
             SELECT id, semantic_version_id, expression, grain, description, variables, created_at
             FROM logical_definition
             WHERE semantic_version_id = ?
         """, (semantic_version_id,))
         row = cursor.fetchone()
-        conn.close()
         if row:
-            return LogicalDefinition.from_db_row(tuple(row))
+            return LogicalDefinition.from_db_row(row)
         return None
 
     def get_physical_mappings(
@@ -111,131 +269,210 @@ class SQLiteMetadataStore:
         logical_definition_id: int,
         engine_type: Optional[str] = None
     ) -> List[PhysicalMapping]:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        conn = _get_connection(self.db_path, readonly=True)
         cursor = conn.cursor()
 
-        query = """
-            SELECT id, logical_definition_id, engine_type, connection_ref,
-                   sql_template, params_schema, priority, description, created_at
-            FROM physical_mapping
-            WHERE logical_definition_id = ?
-        """
-        params = [logical_definition_id]
         if engine_type:
-            query += " AND engine_type = ?"
-            params.append(engine_type)
-        query += " ORDER BY priority DESC"
-
-        cursor.execute(query, params)
-        mappings = [PhysicalMapping.from_db_row(tuple(row)) for row in cursor.fetchall()]
-        conn.close()
+            cursor.execute(_SQL_PHYSMAP_BY_ENGINE, (logical_definition_id, engine_type))
+        else:
+            cursor.execute(_SQL_PHYSMAP_ALL, (logical_definition_id,))
+        mappings = PhysicalMapping.from_db_rows(cursor)
         return mappings
 
     def list_ontology_entities(self) -> List[OntologyEntity]:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-
-        cursor.execute("""
+        conn = _get_connection(self.db_path, readonly=True)
+        cursor = conn.execute("""
             SELECT id, name, description, domain, status, created_at
             FROM ontology_entity
             WHERE status = 'active'
         """)
-        entities = [OntologyEntity.from_db_row(tuple(row)) for row in cursor.fetchall()]
-        conn.close()
+        entities = OntologyEntity.from_db_rows(cursor)
         return entities
 
     def list_dimensions_by_entity(self, entity_id: int) -> List[OntologyDimension]:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-
-        cursor.execute("""
+        conn = _get_connection(self.db_path, readonly=True)
+        cursor = conn.execute("""
             SELECT id, entity_id, name, description, data_type, status, created_at
             FROM ontology_dimension
             WHERE entity_id = ? AND status = 'active'
         """, (entity_id,))
-        dims = [OntologyDimension.from_db_row(tuple(row)) for row in cursor.fetchall()]
-        conn.close()
+        dims = OntologyDimension.from_db_rows(cursor)
         return dims
 
     def list_attributes_by_entity(self, entity_id: int) -> List[OntologyAttribute]:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-
-        cursor.execute("""
+        conn = _get_connection(self.db_path, readonly=True)
+        cursor = conn.execute("""
             SELECT id, entity_id, name, description, data_type, is_key, status, created_at
             FROM ontology_attribute
             WHERE entity_id = ? AND status = 'active'
         """, (entity_id,))
-        attrs = [OntologyAttribute.from_db_row(tuple(row)) for row in cursor.fetchall()]
-        conn.close()
+        attrs = OntologyAttribute.from_db_rows(cursor)
         return attrs
 
-    def list_relationships(self) -> List[OntologyRelationship]:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+    def list_all_dimensions_grouped(self) -> Dict[int, List[OntologyDimension]]:
+        """
+        All active dimensions in one query, grouped by entity id.
 
-        cursor.execute("""
+        Callers walking every entity should prefer this over per-entity
+        list_dimensions_by_entity calls (the N+1 pattern).
+        """
+        conn = _get_connection(self.db_path, readonly=True)
+        cursor = conn.execute("""
+            SELECT id, entity_id, name, description, data_type, status, created_at
+            FROM ontology_dimension
+            WHERE status = 'active'
+            ORDER BY entity_id
+        """)
+        grouped: Dict[int, List[OntologyDimension]] = {}
+        for dim in OntologyDimension.from_db_rows(cursor):
+            grouped.setdefault(dim.entity_id, []).append(dim)
+        return grouped
+
+    def list_all_attributes_grouped(self) -> Dict[int, List[OntologyAttribute]]:
+        """All active attributes in one query, grouped by entity id."""
+        conn = _get_connection(self.db_path, readonly=True)
+        cursor = conn.execute("""
+            SELECT id, entity_id, name, description, data_type, is_key, status, created_at
+            FROM ontology_attribute
+            WHERE status = 'active'
+            ORDER BY entity_id
+        """)
+        grouped: Dict[int, List[OntologyAttribute]] = {}
+        for attr in OntologyAttribute.from_db_rows(cursor):
+            grouped.setdefault(attr.entity_id, []).append(attr)
+        return grouped
+
+    def list_relationships(self) -> List[OntologyRelationship]:
+        conn = _get_connection(self.db_path, readonly=True)
+        cursor = conn.execute("""
             SELECT id, from_entity_id, to_entity_id, relationship_type,
                    description, cardinality, status, created_at
             FROM ontology_relationship
             WHERE status = 'active'
         """)
-        rels = [OntologyRelationship.from_db_row(tuple(row)) for row in cursor.fetchall()]
-        conn.close()
+        rels = OntologyRelationship.from_db_rows(cursor)
         return rels
 
     def list_metric_entity_maps(self) -> List[MetricEntityMap]:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-
-        cursor.execute("""
+        conn = _get_connection(self.db_path, readonly=True)
+        cursor = conn.execute("""
             SELECT id, metric_id, entity_id, grain_level,
                    allowed_dimensions, forbidden_dimensions, join_path_policy, created_at
             FROM metric_entity_map
         """)
-        maps = [MetricEntityMap.from_db_row(tuple(row)) for row in cursor.fetchall()]
-        conn.close()
+        maps = MetricEntityMap.from_db_rows(cursor)
         return maps
 
     def list_metric_dependencies(self) -> List[MetricDependency]:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-
-        cursor.execute("""
+        conn = _get_connection(self.db_path, readonly=True)
+        cursor = conn.execute("""
             SELECT id, upstream_metric_id, downstream_metric_id,
                    upstream_version_id, downstream_version_id,
                    dependency_type, description, created_at
             FROM metric_dependency
         """)
-        deps = [MetricDependency.from_db_row(tuple(row)) for row in cursor.fetchall()]
-        conn.close()
+        deps = MetricDependency.from_db_rows(cursor)
         return deps
 
     def find_terms_in_text(self, text: str) -> List[TermDictionary]:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        conn = _get_connection(self.db_path, readonly=True)
         cursor = conn.cursor()
 
+        # Substring filter pushed into SQLite: instr() scans in C per row
+        # and only matching rows cross back into Python, instead of
+        # transferring the whole dictionary to test `term in text` here.
         cursor.execute("""
             SELECT id, term, normalized_term, object_type, object_id,
                    language, status, created_at
             FROM term_dictionary
             WHERE status = 'active'
+              AND term IS NOT NULL AND term != ''
+              AND instr(?, term) > 0
+        """, (text,))
+        return TermDictionary.from_db_rows(cursor)
+
+    def fetch_graph_snapshot(self) -> GraphSnapshot:
+        """
+        Fetch all dependency-graph edges in one connection.
+
+        Replaces the per-entity / per-version fan-out that the graph
+        builder otherwise performs (one query per entity for dimensions
+        and attributes, one per version for logical definitions).
+        """
+        conn = _get_connection(self.db_path, readonly=True)
+        cursor = conn.cursor()
+        # Plain tuples: edge lists are compared and unpacked as tuples
+        cursor.row_factory = None
+
+        cursor.execute("""
+            SELECT metric_id, entity_id, allowed_dimensions
+            FROM metric_entity_map
         """)
-        terms = []
-        for row in cursor.fetchall():
-            term = row['term']
-            if term and term in text:
-                terms.append(TermDictionary.from_db_row(tuple(row)))
-        conn.close()
-        return terms
+        metric_entity_rows = cursor.fetchall()
+
+        cursor.execute("""
+            SELECT entity_id, id, name
+            FROM ontology_dimension
+            WHERE status = 'active'
+        """)
+        dims_by_entity: Dict[int, List[tuple]] = {}
+        for entity_id, dim_id, dim_name in cursor.fetchall():
+            dims_by_entity.setdefault(entity_id, []).append((dim_id, dim_name))
+
+        cursor.execute("""
+            SELECT entity_id, id
+            FROM ontology_attribute
+            WHERE status = 'active'
+        """)
+        attrs_by_entity: Dict[int, List[int]] = {}
+        for entity_id, attr_id in cursor.fetchall():
+            attrs_by_entity.setdefault(entity_id, []).append(attr_id)
+
+        cursor.execute("""
+            SELECT so.id, pm.id
+            FROM semantic_object so
+            JOIN semantic_version sv ON sv.semantic_object_id = so.id
+            JOIN logical_definition ld ON ld.semantic_version_id = sv.id
+            JOIN physical_mapping pm ON pm.logical_definition_id = ld.id
+            WHERE so.status = 'active'
+        """)
+        metric_mapping_edges = cursor.fetchall()
+
+        cursor.execute("""
+            SELECT upstream_metric_id, downstream_metric_id,
+                   upstream_version_id, downstream_version_id
+            FROM metric_dependency
+        """)
+        dependency_rows = cursor.fetchall()
+
+        metric_entity_edges = []
+        metric_dimension_edges = []
+        metric_attribute_edges = []
+        for metric_id, entity_id, allowed_json in metric_entity_rows:
+            metric_entity_edges.append((metric_id, entity_id))
+            allowed = set(json.loads(allowed_json)) if allowed_json else set()
+            for dim_id, dim_name in dims_by_entity.get(entity_id, []):
+                if not allowed or dim_name in allowed:
+                    metric_dimension_edges.append((metric_id, dim_id))
+            for attr_id in attrs_by_entity.get(entity_id, []):
+                metric_attribute_edges.append((metric_id, attr_id))
+
+        version_dependency_edges = []
+        metric_dependency_edges = []
+        for up_metric, down_metric, up_version, down_version in dependency_rows:
+            version_dependency_edges.append(
+                (down_version or down_metric, up_version or up_metric)
+            )
+            metric_dependency_edges.append((down_metric, up_metric))
+
+        return GraphSnapshot(
+            metric_entity_edges=metric_entity_edges,
+            metric_dimension_edges=metric_dimension_edges,
+            metric_attribute_edges=metric_attribute_edges,
+            metric_mapping_edges=metric_mapping_edges,
+            version_dependency_edges=version_dependency_edges,
+            metric_dependency_edges=metric_dependency_edges
+        )
 
     def replace_metric_dependencies_for_version(
         self,
@@ -243,29 +480,30 @@ class SQLiteMetadataStore:
         downstream_version_id: int,
         dependencies: List[MetricDependency]
     ) -> None:
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
+        conn = _get_connection(self.db_path)
+        cursor = conn.execute("""
             DELETE FROM metric_dependency
             WHERE downstream_metric_id = ? AND downstream_version_id = ?
         """, (downstream_metric_id, downstream_version_id))
 
-        for dep in dependencies:
-            cursor.execute("""
-                INSERT INTO metric_dependency (
-                    upstream_metric_id, downstream_metric_id,
-                    upstream_version_id, downstream_version_id,
-                    dependency_type, description
-                ) VALUES (?, ?, ?, ?, ?, ?)
-            """, (
+        # One prepared statement bound for all rows, not one execute per
+        # dependency
+        cursor.executemany("""
+            INSERT INTO metric_dependency (
+                upstream_metric_id, downstream_metric_id,
+                upstream_version_id, downstream_version_id,
+                dependency_type, description
+            ) VALUES (?, ?, ?, ?, ?, ?)
+        """, [
+            (
                 dep.upstream_metric_id, dep.downstream_metric_id,
                 dep.upstream_version_id, dep.downstream_version_id,
                 dep.dependency_type, dep.description
-            ))
+            )
+            for dep in dependencies
+        ])
 
         conn.commit()
-        conn.close()
 
 
 class SQLitePolicyStore:
@@ -277,31 +515,23 @@ class SQLitePolicyStore:
         semantic_object_id: int,
         role: str,
         action: str
-    ) -> List[AccessPolicy]:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-
-        cursor.execute("""
+    ) -> Tuple[AccessPolicy, ...]:
+        conn = _get_connection(self.db_path, readonly=True)
+        cursor = conn.execute("""
             SELECT id, semantic_object_id, role, action, condition,
                    effect, priority, created_at
             FROM access_policy
             WHERE semantic_object_id = ?
-              AND (role = ? OR role = '*')
-              AND (action = ? OR action = '*')
+              AND role IN (?, '*')
+              AND action IN (?, '*')
             ORDER BY priority DESC
         """, (semantic_object_id, role, action))
 
-        policies = [AccessPolicy.from_db_row(tuple(row)) for row in cursor.fetchall()]
-        conn.close()
-        return policies
+        return tuple(AccessPolicy.from_db_rows(cursor))
 
     def get_user_policies(self, role: str) -> List[Dict[str, Any]]:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-
-        cursor.execute("""
+        conn = _get_connection(self.db_path, readonly=True)
+        cursor = conn.execute("""
             SELECT ap.id, ap.role, ap.action, ap.effect, ap.priority,
                    so.name as semantic_object_name, so.domain
             FROM access_policy ap
@@ -322,7 +552,6 @@ class SQLitePolicyStore:
                 'priority': row['priority']
             })
 
-        conn.close()
         return policies
 
     def create_policy(
@@ -334,10 +563,10 @@ class SQLitePolicyStore:
         condition: Optional[Dict[str, Any]] = None,
         priority: int = 0
     ) -> int:
-        conn = sqlite3.connect(self.db_path)
+        conn = _get_connection(self.db_path)
         cursor = conn.cursor()
 
-        condition_json = json.dumps(condition) if condition else None
+        condition_json = json_dumps(condition) if condition else None
 
         cursor.execute("""
             INSERT INTO access_policy
@@ -347,40 +576,116 @@ class SQLitePolicyStore:
 
         policy_id = cursor.lastrowid
         conn.commit()
-        conn.close()
         return policy_id
 
+    def create_policies_bulk(self, policies: List[Dict[str, Any]]) -> int:
+        """
+        Insert many policies in one transaction via executemany, chunked
+        so very large imports keep memory flat.
+
+        Each dict carries the create_policy keyword arguments. Returns
+        the number of rows inserted. All-or-nothing: a malformed entry
+        anywhere in the batch rolls back the whole insert.
+        """
+        # Build every row up front so key errors surface before any SQL runs
+        rows = [
+            (
+                p['semantic_object_id'],
+                p['role'],
+                p['action'],
+                json_dumps(p['condition']) if p.get('condition') else None,
+                p['effect'],
+                p.get('priority', 0),
+            )
+            for p in policies
+        ]
+
+        conn = _get_connection(self.db_path)
+        cursor = conn.cursor()
+
+        sql = """
+            INSERT INTO access_policy
+            (semantic_object_id, role, action, condition, effect, priority)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """
+        try:
+            for start in range(0, len(rows), 1000):
+                cursor.executemany(sql, rows[start:start + 1000])
+        except Exception:
+            # Drop the partial batch; the cached connection must not hold
+            # uncommitted rows across calls
+            conn.rollback()
+            raise
+        conn.commit()
+        return len(rows)
+
 
 class SQLiteAuditStore:
+    # Statement texts are shared between single and batch saves; SQLite's
+    # per-connection statement cache (cached_statements) keys on the SQL
+    # text, so a stable string means the parse/plan happens once.
+    _INSERT_AUDIT_SQL = """
+        INSERT INTO execution_audit (
+            audit_id, question, semantic_object_id, semantic_object_name,
+            version_id, version_name, logical_definition_id, logical_expression,
+            physical_mapping_id, connection_ref, final_sql,
+            request_params, execution_context, user_id, user_role, policy_decision, executed_at, status,
+            row_count, execution_time_ms, error_message
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    _INSERT_TRACE_SQL = """
+        INSERT INTO audit_trace (audit_id, trace_json) VALUES (?, ?)
+    """
+
     def __init__(self, db_path: str):
         self.db_path = db_path
 
     def save_audit(self, audit: ExecutionAudit) -> None:
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            INSERT INTO execution_audit (
-                audit_id, question, semantic_object_id, semantic_object_name,
-                version_id, version_name, logical_definition_id, logical_expression,
-                physical_mapping_id, connection_ref, final_sql, decision_trace,
-                request_params, execution_context, user_id, user_role, policy_decision, executed_at, status,
-                row_count, execution_time_ms, error_message
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        conn = _get_connection(self.db_path)
+        cursor = conn.execute(self._INSERT_AUDIT_SQL, (
             audit.audit_id, audit.question, audit.semantic_object_id, audit.semantic_object_name,
             audit.version_id, audit.version_name, audit.logical_definition_id, audit.logical_expression,
             audit.physical_mapping_id, audit.connection_ref, audit.final_sql,
-            json.dumps(audit.decision_trace),
-            json.dumps(audit.request_params) if audit.request_params is not None else None,
-            json.dumps(audit.execution_context) if audit.execution_context is not None else None,
+            audit.request_params_as_json(),
+            audit.execution_context_as_json(),
             audit.user_id, audit.user_role, audit.policy_decision,
             audit.executed_at.isoformat() if audit.executed_at else None,
             audit.status, audit.row_count, audit.execution_time_ms, audit.error_message
         ))
+        cursor.execute(self._INSERT_TRACE_SQL, (audit.audit_id, audit.trace_as_json()))
+
+        conn.commit()
+
+    def save_audit_batch(self, audits: List[ExecutionAudit]) -> None:
+        """Insert many audit records in one transaction."""
+        if not audits:
+            return
+
+        conn = _get_connection(self.db_path)
+        cursor = conn.cursor()
+
+        # Take the write lock up front; the batch holds it for one
+        # commit instead of upgrading from a read lock mid-transaction
+        cursor.execute("BEGIN IMMEDIATE")
+        cursor.executemany(self._INSERT_AUDIT_SQL, [
+            (
+                audit.audit_id, audit.question, audit.semantic_object_id, audit.semantic_object_name,
+                audit.version_id, audit.version_name, audit.logical_definition_id, audit.logical_expression,
+                audit.physical_mapping_id, audit.connection_ref, audit.final_sql,
+                audit.request_params_as_json(),
+                audit.execution_context_as_json(),
+                audit.user_id, audit.user_role, audit.policy_decision,
+                audit.executed_at.isoformat() if audit.executed_at else None,
+                audit.status, audit.row_count, audit.execution_time_ms, audit.error_message
+            )
+            for audit in audits
+        ])
+        cursor.executemany(self._INSERT_TRACE_SQL, [
+            (audit.audit_id, audit.trace_as_json())
+            for audit in audits
+        ])
 
         conn.commit()
-        conn.close()
 
     def save_denied(
         self,
@@ -391,74 +696,106 @@ class SQLiteAuditStore:
         context: ExecutionContext,
         error: str
     ) -> None:
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
+        conn = _get_connection(self.db_path)
+        cursor = conn.execute("""
             INSERT INTO execution_audit (
                 audit_id, question, semantic_object_id, semantic_object_name,
-                decision_trace, request_params, execution_context, user_id, user_role, executed_at, status, error_message
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                request_params, execution_context, user_id, user_role, executed_at, status, error_message
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """, (
             audit_id, question,
             semantic_obj.id if semantic_obj else None,
             semantic_obj.name if semantic_obj else None,
-            json.dumps({'steps': decision_trace}),
-            json.dumps(context.parameters) if context.parameters else None,
-            json.dumps(context.to_dict()),
+            json_dumps(context.parameters) if context.parameters else None,
+            context.to_json(),
             context.user_id, context.role, context.timestamp.isoformat(),
             'denied', error
         ))
+        cursor.execute(self._INSERT_TRACE_SQL, (audit_id, json_dumps({'steps': decision_trace})))
 
         conn.commit()
-        conn.close()
 
     def load_audit(self, audit_id: str) -> Optional[ExecutionAudit]:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            SELECT id, audit_id, question, semantic_object_id, semantic_object_name,
-                   version_id, version_name, logical_definition_id, logical_expression,
-                   physical_mapping_id, connection_ref, final_sql, decision_trace,
-                   request_params, execution_context,
-                   user_id, user_role, policy_decision, executed_at, status,
-                   row_count, execution_time_ms, error_message
-            FROM execution_audit
-            WHERE audit_id = ?
+        conn = _get_connection(self.db_path, readonly=True)
+        cursor = conn.execute("""
+            SELECT ea.id, ea.audit_id, ea.question, ea.semantic_object_id, ea.semantic_object_name,
+                   ea.version_id, ea.version_name, ea.logical_definition_id, ea.logical_expression,
+                   ea.physical_mapping_id, ea.connection_ref, ea.final_sql, at.trace_json,
+                   ea.request_params, ea.execution_context,
+                   ea.user_id, ea.user_role, ea.policy_decision, ea.executed_at, ea.status,
+                   ea.row_count, ea.execution_time_ms, ea.error_message
+            FROM execution_audit ea
+            LEFT JOIN audit_trace at ON at.audit_id = ea.audit_id
+            WHERE ea.audit_id = ?
         """, (audit_id,))
         row = cursor.fetchone()
-        conn.close()
         if row:
-            return ExecutionAudit.from_db_row(tuple(row))
+            return ExecutionAudit.from_db_row(row)
+        return None
+
+    def get_audit_trace(self, audit_id: str) -> Optional[Dict[str, Any]]:
+        """Load only the decision trace for an audit record."""
+        conn = _get_connection(self.db_path, readonly=True)
+        cursor = conn.execute("""
+            SELECT trace_json FROM audit_trace WHERE audit_id = ?
+        """, (audit_id,))
+        row = cursor.fetchone()
+        if row and row[0]:
+            return json.loads(row[0])
         return None
 
     def list_audit_history(
         self,
         limit: int = 50,
-        user_id: Optional[int] = None
+        user_id: Optional[int] = None,
+        before_executed_at: Optional[str] = None
     ) -> List[Dict[str, Any]]:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        """
+        Most recent audit rows, newest first.
+
+        Pass the executed_at of the last row from the previous page as
+        before_executed_at (ISO text, as stored) to page by keyset
+        rather than offset.
+        """
+        conn = _get_connection(self.db_path, readonly=True)
         cursor = conn.cursor()
 
-        query = """
-            SELECT audit_id, question, semantic_object_name, user_role,
-                   executed_at, status, row_count
-            FROM execution_audit
+        if before_executed_at is not None:
+            if user_id:
+                cursor.execute(_SQL_HISTORY_BY_USER_BEFORE,
+                               (user_id, before_executed_at, limit))
+            else:
+                cursor.execute(_SQL_HISTORY_ALL_BEFORE, (before_executed_at, limit))
+        elif user_id:
+            cursor.execute(_SQL_HISTORY_BY_USER, (user_id, limit))
+        else:
+            cursor.execute(_SQL_HISTORY_ALL, (limit,))
+        # Build the dicts straight off the cursor; no intermediate Row list
+        return [dict(row) for row in cursor]
+
+    def iter_audit_history(
+        self,
+        limit: Optional[int] = None,
+        user_id: Optional[int] = None
+    ):
         """
-        params = []
-        if user_id:
-            query += " WHERE user_id = ?"
-            params.append(user_id)
-        query += " ORDER BY executed_at DESC LIMIT ?"
-        params.append(limit)
+        Stream audit history rows one dict at a time.
 
-        cursor.execute(query, params)
-        history = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return history
+        For exports and pagination over large histories this keeps memory
+        flat instead of materializing the whole result set.
+        """
+        conn = _get_connection(self.db_path, readonly=True)
+        cursor = conn.cursor()
+
+        # LIMIT -1 is SQLite's "no limit", so the unbounded case shares
+        # the same statement text as the bounded one
+        bound = limit if limit is not None else -1
+        if user_id:
+            cursor.execute(_SQL_HISTORY_BY_USER, (user_id, bound))
+        else:
+            cursor.execute(_SQL_HISTORY_ALL, (bound,))
+        for row in cursor:
+            yield dict(row)
 
 
 class SQLiteQueryExecutor:
@@ -471,10 +808,14 @@ class SQLiteQueryExecutor:
         connection_ref: Optional[str] = None,
         parameters: Optional[Dict[str, Any]] = None
     ) -> List[Dict[str, Any]]:
-        conn = sqlite3.connect(self.data_db_path)
-        conn.row_factory = sqlite3.Row
+        conn = _get_connection(self.data_db_path, readonly=True)
         cursor = conn.cursor()
+        # Plain tuples + one shared key tuple: cheaper than building a
+        # sqlite3.Row per result row only to convert it with dict(row).
+        # The list-of-dicts contract stays as-is for API payloads.
+        cursor.row_factory = None
         cursor.execute(sql, parameters or {})
-        rows = cursor.fetchall()
-        conn.close()
-        return [dict(row) for row in rows]
+        if cursor.description is None:
+            return []
+        names = tuple(col[0] for col in cursor.description)
+        return [dict(zip(names, row)) for row in cursor]
@@ -4,8 +4,7 @@ Pytest configuration and shared fixtures for semantic layer tests.
 
 import pytest
 import sqlite3
-import tempfile
-import shutil
+import uuid
 from pathlib import Path
 from datetime import datetime
 
@@ -14,31 +13,43 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 
-@pytest.fixture
-def test_db_path():
-    """Create a temporary database for testing."""
-    # Create temp directory
-    temp_dir = tempfile.mkdtemp()
-    db_path = str(Path(temp_dir) / "test_semantic_layer.db")
+@pytest.fixture(scope='session')
+def _template_db_path(tmp_path_factory):
+    """Build the schema+seed database once per session."""
+    db_path = str(tmp_path_factory.mktemp("template") / "template_semantic_layer.db")
 
-    # Create schema
     with open(Path(__file__).parent.parent / 'schema.sql', 'r') as f:
         schema_sql = f.read()
 
     with open(Path(__file__).parent.parent / 'seed_data.sql', 'r') as f:
         seed_sql = f.read()
 
-    # Initialize database
     conn = sqlite3.connect(db_path)
     conn.executescript(schema_sql)
     conn.executescript(seed_sql)
     conn.commit()
     conn.close()
 
-    yield db_path
+    return db_path
+
 
-    # Cleanup
-    shutil.rmtree(temp_dir, ignore_errors=True)
+@pytest.fixture
+def test_db_path(_template_db_path):
+    """Create an in-memory database for testing, seeded from the template."""
+    # Shared-cache memory URI: every connection a test opens to this path
+    # sees the same database, and nothing touches the filesystem
+    db_uri = f"file:testdb_{uuid.uuid4().hex}?mode=memory&cache=shared"
+
+    # The memory database lives only while at least one connection is
+    # open, so keep one for the duration of the test
+    keeper = sqlite3.connect(db_uri, uri=True)
+    template = sqlite3.connect(_template_db_path)
+    template.backup(keeper)
+    template.close()
+
+    yield db_uri
+
+    keeper.close()
 
 
 @pytest.fixture
@@ -1,9 +1,8 @@
-import sqlite3
-
 from semantic_layer.sqlite_stores import SQLiteMetadataStore
 from semantic_layer.impact_analysis import ImpactAnalyzer
 from semantic_layer.dependency_builder import DependencyBuilder
 
+from tests.fixtures.db_fixtures import fetch_all
 from tests.fixtures.semantic_fixtures import (
     create_version,
     create_logical_definition,
@@ -51,9 +50,11 @@ def test_report_version_consistency(test_db_path):
 
 
 def _fetch_dependencies(db_path: str, metric_id: int, version_id: int):
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute(
+    # Goes through the URI-aware fixture helper: db_path is a file:
+    # memory URI, which a raw sqlite3.connect would mistake for a
+    # filename on builds without URI support enabled
+    return fetch_all(
+        db_path,
         """
         SELECT downstream_metric_id, downstream_version_id
         FROM metric_dependency
@@ -61,6 +62,3 @@ def _fetch_dependencies(db_path: str, metric_id: int, version_id: int):
         """,
         (metric_id, version_id)
     )
-    rows = cursor.fetchall()
-    conn.close()
-    return rows
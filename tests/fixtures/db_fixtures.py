@@ -1,29 +1,31 @@
 import sqlite3
+from functools import lru_cache
 from typing import Iterable, Tuple
 
 
+@lru_cache(maxsize=32)
+def get_connection(db_path: str) -> sqlite3.Connection:
+    """One cached connection per database path.
+
+    The helpers below used to open and close a fresh connection per
+    call, which dominated wall time in insert-heavy tests. uri=True
+    keeps the in-memory shared-cache test databases working regardless
+    of how the local SQLite build treats URI filenames.
+    """
+    return sqlite3.connect(db_path, uri=db_path.startswith("file:"))
+
+
 def exec_sql(db_path: str, statements: Iterable[Tuple[str, tuple]]) -> None:
-    conn = sqlite3.connect(db_path)
+    conn = get_connection(db_path)
     cursor = conn.cursor()
     for sql, params in statements:
         cursor.execute(sql, params)
     conn.commit()
-    conn.close()
 
 
 def fetch_one(db_path: str, sql: str, params: tuple = ()) -> tuple:
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute(sql, params)
-    row = cursor.fetchone()
-    conn.close()
-    return row
+    return get_connection(db_path).execute(sql, params).fetchone()
 
 
 def fetch_all(db_path: str, sql: str, params: tuple = ()) -> list:
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute(sql, params)
-    rows = cursor.fetchall()
-    conn.close()
-    return rows
+    return get_connection(db_path).execute(sql, params).fetchall()
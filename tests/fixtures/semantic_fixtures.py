@@ -1,6 +1,7 @@
-import sqlite3
 from typing import Dict, Any
 
+from .db_fixtures import get_connection
+
 
 def create_metric(
     db_path: str,
@@ -10,9 +11,8 @@ def create_metric(
     domain: str = "quality",
     status: str = "active"
 ) -> int:
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute(
+    conn = get_connection(db_path)
+    cursor = conn.execute(
         """
         INSERT INTO semantic_object (name, description, aliases, domain, status)
         VALUES (?, ?, ?, ?, ?)
@@ -21,7 +21,6 @@ def create_metric(
     )
     metric_id = cursor.lastrowid
     conn.commit()
-    conn.close()
     return metric_id
 
 
@@ -34,9 +33,8 @@ def create_version(
     priority: int = 0,
     description: str = ""
 ) -> int:
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute(
+    conn = get_connection(db_path)
+    cursor = conn.execute(
         """
         INSERT INTO semantic_version
         (semantic_object_id, version_name, effective_from, scenario_condition, is_active, priority, description)
@@ -46,7 +44,6 @@ def create_version(
     )
     version_id = cursor.lastrowid
     conn.commit()
-    conn.close()
     return version_id
 
 
@@ -58,9 +55,8 @@ def create_logical_definition(
     description: str,
     variables_json: str
 ) -> int:
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute(
+    conn = get_connection(db_path)
+    cursor = conn.execute(
         """
         INSERT INTO logical_definition
         (semantic_version_id, expression, grain, description, variables)
@@ -70,7 +66,6 @@ def create_logical_definition(
     )
     logical_id = cursor.lastrowid
     conn.commit()
-    conn.close()
     return logical_id
 
 
@@ -84,9 +79,8 @@ def create_mapping(
     connection_ref: str = "default",
     description: str = ""
 ) -> int:
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute(
+    conn = get_connection(db_path)
+    cursor = conn.execute(
         """
         INSERT INTO physical_mapping
         (logical_definition_id, engine_type, connection_ref, sql_template, params_schema, priority, description)
@@ -96,7 +90,6 @@ def create_mapping(
     )
     mapping_id = cursor.lastrowid
     conn.commit()
-    conn.close()
     return mapping_id
 
 
@@ -109,9 +102,8 @@ def create_term(
     language: str = "zh",
     status: str = "active"
 ) -> int:
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute(
+    conn = get_connection(db_path)
+    cursor = conn.execute(
         """
         INSERT INTO term_dictionary
         (term, normalized_term, object_type, object_id, language, status)
@@ -121,5 +113,4 @@ def create_term(
     )
     term_id = cursor.lastrowid
     conn.commit()
-    conn.close()
     return term_id
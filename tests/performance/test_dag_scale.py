@@ -12,61 +12,76 @@ MAX_IMPACT_SECONDS = 1.5
 MAX_DIFF_SECONDS = 1.5
 
 
-def _init_db(db_path: str):
+def _init_db(db_path: str) -> sqlite3.Connection:
     schema_sql = Path(__file__).parent.parent.parent / "schema.sql"
-    conn = sqlite3.connect(db_path)
+    conn = sqlite3.connect(db_path, uri=True)
     conn.executescript(schema_sql.read_text(encoding="utf-8"))
     conn.commit()
-    conn.close()
+    return conn
 
 
-def test_dag_scale_performance(tmp_path):
-    db_path = str(tmp_path / "scale.db")
-    _init_db(db_path)
+def test_dag_scale_performance():
+    # Shared-cache memory database: the timings below measure graph
+    # work, not disk I/O. The keeper connection from _init_db holds the
+    # database alive until the test returns.
+    db_path = "file:dagscale_test?mode=memory&cache=shared"
+    keeper = _init_db(db_path)
 
-    conn = sqlite3.connect(db_path)
+    conn = sqlite3.connect(db_path, uri=True)
     cursor = conn.cursor()
 
+    # The seed is throwaway bulk data: relax durability and batch each
+    # table with executemany inside one transaction so setup stays
+    # sub-second instead of paying per-row parse/bind/commit costs.
+    cursor.execute("PRAGMA journal_mode=MEMORY")
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-65536")
+
     num_metrics = 420
-    metrics = []
-    for i in range(1, num_metrics + 1):
-        name = f"Metric{i}"
-        cursor.execute(
-            "INSERT INTO semantic_object (name, description, aliases, domain, status) VALUES (?, ?, ?, ?, 'active')",
-            (name, name, "[]", "quality")
-        )
-        metrics.append((cursor.lastrowid, name))
+    names = [f"Metric{i}" for i in range(1, num_metrics + 1)]
 
-    for metric_id, name in metrics:
-        cursor.execute(
-            "INSERT INTO semantic_version (semantic_object_id, version_name, effective_from, scenario_condition, is_active, priority, description) "
-            "VALUES (?, ?, '2024-01-01 00:00:00', NULL, 1, 0, ?)",
-            (metric_id, f"{name}_v1", name)
-        )
-        version_id = cursor.lastrowid
-        idx = int(name.replace("Metric", ""))
-        refs = []
-        if idx > 6:
-            refs = [
-                f"{{{{ metric:Metric{idx-1} }}}}",
-                f"{{{{ metric:Metric{idx-2} }}}}",
-                f"{{{{ metric:Metric{idx-3} }}}}",
-                f"{{{{ metric:Metric{idx-4} }}}}",
-                f"{{{{ metric:Metric{idx-5} }}}}",
-            ]
-        expr = " + ".join(refs) if refs else "1"
-        cursor.execute(
-            "INSERT INTO logical_definition (semantic_version_id, expression, grain, description, variables) "
-            "VALUES (?, ?, 'line,day', ?, '[]')",
-            (version_id, expr, name)
-        )
-        logical_id = cursor.lastrowid
-        cursor.execute(
-            "INSERT INTO physical_mapping (logical_definition_id, engine_type, connection_ref, sql_template, params_schema, priority, description) "
-            "VALUES (?, 'sqlite', 'default', 'SELECT 1', '{\"line\":\"string\",\"start_date\":\"date\",\"end_date\":\"date\"}', 1, 'scale')",
-            (logical_id,)
+    cursor.execute("BEGIN")
+    cursor.executemany(
+        "INSERT INTO semantic_object (name, description, aliases, domain, status) VALUES (?, ?, '[]', 'quality', 'active')",
+        [(name, name) for name in names]
+    )
+    cursor.execute("SELECT id, name FROM semantic_object")
+    metric_id_by_name = {name: id for id, name in cursor.fetchall()}
+    metrics = [(metric_id_by_name[name], name) for name in names]
+
+    cursor.executemany(
+        "INSERT INTO semantic_version (semantic_object_id, version_name, effective_from, scenario_condition, is_active, priority, description) "
+        "VALUES (?, ?, '2024-01-01 00:00:00', NULL, 1, 0, ?)",
+        [(metric_id, f"{name}_v1", name) for metric_id, name in metrics]
+    )
+    cursor.execute("SELECT id, description FROM semantic_version")
+    version_id_by_name = {name: id for id, name in cursor.fetchall()}
+
+    def expr_for(idx: int) -> str:
+        if idx <= 6:
+            return "1"
+        return " + ".join(
+            f"{{{{ metric:Metric{idx - offset} }}}}" for offset in range(1, 6)
         )
 
+    cursor.executemany(
+        "INSERT INTO logical_definition (semantic_version_id, expression, grain, description, variables) "
+        "VALUES (?, ?, 'line,day', ?, '[]')",
+        [
+            (version_id_by_name[name], expr_for(i), name)
+            for i, name in enumerate(names, start=1)
+        ]
+    )
+    cursor.execute("SELECT id, description FROM logical_definition")
+    logical_ids = [id for id, _ in cursor.fetchall()]
+
+    cursor.executemany(
+        "INSERT INTO physical_mapping (logical_definition_id, engine_type, connection_ref, sql_template, params_schema, priority, description) "
+        "VALUES (?, 'sqlite', 'default', 'SELECT 1', '{\"line\":\"string\",\"start_date\":\"date\",\"end_date\":\"date\"}', 1, 'scale')",
+        [(logical_id,) for logical_id in logical_ids]
+    )
+
     conn.commit()
     conn.close()
 
@@ -92,3 +107,5 @@ def test_dag_scale_performance(tmp_path):
     diff_time = time.perf_counter() - start
     assert diff_time < MAX_DIFF_SECONDS
     assert diff["risk"] == "L1"
+
+    keeper.close()
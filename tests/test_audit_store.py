@@ -0,0 +1,152 @@
+"""
+Unit tests for SQLiteAuditStore history listing and trace storage.
+"""
+
+from semantic_layer.models import json_dumps
+from semantic_layer.orchestrator import SemanticOrchestrator, TraceBuffer
+from semantic_layer.sqlite_stores import SQLiteAuditStore
+
+from tests.fixtures.db_fixtures import exec_sql
+
+
+def _insert_audit(db_path, audit_id, executed_at, user_id=1, status='success'):
+    exec_sql(db_path, [(
+        """
+        INSERT INTO execution_audit
+        (audit_id, question, semantic_object_name, user_id, user_role,
+         executed_at, status, row_count)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        (audit_id, 'test question', 'FPY', user_id, 'operator',
+         executed_at, status, 1)
+    )])
+
+
+class TestListAuditHistoryKeyset:
+    """Test keyset pagination on list_audit_history."""
+
+    def test_pages_through_history(self, test_db_path):
+        """before_executed_at resumes exactly where the last page ended."""
+        for i in range(5):
+            _insert_audit(test_db_path, f'AUD-{i}', f'2024-01-0{i + 1}T00:00:00')
+        store = SQLiteAuditStore(test_db_path)
+
+        first_page = store.list_audit_history(limit=2)
+        assert [r['audit_id'] for r in first_page] == ['AUD-4', 'AUD-3']
+
+        second_page = store.list_audit_history(
+            limit=2, before_executed_at=first_page[-1]['executed_at']
+        )
+        assert [r['audit_id'] for r in second_page] == ['AUD-2', 'AUD-1']
+
+        third_page = store.list_audit_history(
+            limit=2, before_executed_at=second_page[-1]['executed_at']
+        )
+        assert [r['audit_id'] for r in third_page] == ['AUD-0']
+
+        last_page = store.list_audit_history(
+            limit=2, before_executed_at=third_page[-1]['executed_at']
+        )
+        assert last_page == []
+
+    def test_duplicate_timestamp_boundary(self, test_db_path):
+        """The bound is strict: rows sharing the boundary executed_at are
+        excluded from the next page, so a page must fully consume one
+        timestamp before its executed_at is safe to pass as the cursor."""
+        _insert_audit(test_db_path, 'AUD-old', '2024-01-01T00:00:00')
+        _insert_audit(test_db_path, 'AUD-dup-a', '2024-01-02T00:00:00')
+        _insert_audit(test_db_path, 'AUD-dup-b', '2024-01-02T00:00:00')
+        store = SQLiteAuditStore(test_db_path)
+
+        next_page = store.list_audit_history(
+            limit=10, before_executed_at='2024-01-02T00:00:00'
+        )
+        assert [r['audit_id'] for r in next_page] == ['AUD-old']
+
+        # A page large enough to hold both duplicates returns them together
+        full = store.list_audit_history(limit=10)
+        assert {r['audit_id'] for r in full[:2]} == {'AUD-dup-a', 'AUD-dup-b'}
+
+    def test_keyset_with_user_filter(self, test_db_path):
+        """before_executed_at composes with the user_id filter."""
+        _insert_audit(test_db_path, 'AUD-u1-a', '2024-01-01T00:00:00', user_id=1)
+        _insert_audit(test_db_path, 'AUD-u2-a', '2024-01-02T00:00:00', user_id=2)
+        _insert_audit(test_db_path, 'AUD-u1-b', '2024-01-03T00:00:00', user_id=1)
+        _insert_audit(test_db_path, 'AUD-u1-c', '2024-01-04T00:00:00', user_id=1)
+        store = SQLiteAuditStore(test_db_path)
+
+        first_page = store.list_audit_history(limit=1, user_id=1)
+        assert [r['audit_id'] for r in first_page] == ['AUD-u1-c']
+
+        rest = store.list_audit_history(
+            limit=10, user_id=1, before_executed_at=first_page[-1]['executed_at']
+        )
+        assert [r['audit_id'] for r in rest] == ['AUD-u1-b', 'AUD-u1-a']
+
+
+class TestIterAuditHistory:
+    """Test the streaming audit history generator."""
+
+    def test_matches_list_form(self, test_db_path):
+        """Streaming yields exactly the rows of the list form, in order."""
+        for i in range(150):
+            _insert_audit(
+                test_db_path, f'AUD-{i:03d}',
+                f'2024-01-01T{i // 60:02d}:{i % 60:02d}:00',
+                user_id=1 + i % 3
+            )
+        store = SQLiteAuditStore(test_db_path)
+
+        streamed = list(store.iter_audit_history())
+        listed = store.list_audit_history(limit=1000)
+        assert streamed == listed
+        assert len(streamed) == 150
+        # No duplicated or skipped rows
+        assert len({r['audit_id'] for r in streamed}) == 150
+
+    def test_limit_and_user_filter(self, test_db_path):
+        """limit and user_id behave as in list_audit_history."""
+        for i in range(10):
+            _insert_audit(
+                test_db_path, f'AUD-{i}',
+                f'2024-01-0{i % 9 + 1}T00:00:0{i % 10}',
+                user_id=1 + i % 2
+            )
+        store = SQLiteAuditStore(test_db_path)
+
+        assert list(store.iter_audit_history(limit=4)) == \
+            store.list_audit_history(limit=4)
+        assert list(store.iter_audit_history(user_id=2)) == \
+            store.list_audit_history(limit=1000, user_id=2)
+
+
+class TestColumnarTraceRoundTrip:
+    """Test the compact columnar trace storage format."""
+
+    def test_columnar_trace_round_trips_through_store(self, test_db_path):
+        """Columnar encode -> store -> get_audit_trace equals the row form."""
+        buffer = TraceBuffer()
+        buffer.add('semantic_resolution', {'object': 'FPY', 'score': 0.9})
+        buffer.add('version_resolution', {'version': 'FPY_v2', 'candidates': 2})
+        buffer.add('policy_check', {'allow': True, 'role': 'operator'})
+
+        exec_sql(test_db_path, [(
+            "INSERT INTO audit_trace (audit_id, trace_json) VALUES (?, ?)",
+            ('AUD-columnar', json_dumps(buffer.to_columnar()))
+        )])
+
+        orchestrator = SemanticOrchestrator(test_db_path)
+        expanded = orchestrator.get_audit_trace('AUD-columnar')
+
+        assert expanded == buffer.materialize()
+
+    def test_row_form_trace_unchanged(self, test_db_path):
+        """Traces stored as step lists come back as-is, no expansion."""
+        steps = [{'step': 'policy_check', 'timestamp': '2024-01-01T00:00:00', 'data': {}}]
+        exec_sql(test_db_path, [(
+            "INSERT INTO audit_trace (audit_id, trace_json) VALUES (?, ?)",
+            ('AUD-rows', json_dumps({'steps': steps}))
+        )])
+
+        orchestrator = SemanticOrchestrator(test_db_path)
+        assert orchestrator.get_audit_trace('AUD-rows') == steps
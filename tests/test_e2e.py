@@ -183,12 +183,12 @@ class TestE2EHappyPath:
 
         # Verify key steps are present
         step_names = [step['step'] for step in trace]
-        assert 'resolve_semantic_object_complete' in step_names
-        assert 'resolve_version_complete' in step_names
-        assert 'resolve_logic_complete' in step_names
-        assert 'resolve_physical_mapping_complete' in step_names
-        assert 'policy_check_complete' in step_names
-        assert 'execution_complete' in step_names
+        assert 'resolve_semantic_object' in step_names
+        assert 'resolve_version' in step_names
+        assert 'resolve_logic' in step_names
+        assert 'resolve_physical_mapping' in step_names
+        assert 'policy_check' in step_names
+        assert 'execution' in step_names
 
 
 class TestE2EPolicyDeny:
@@ -437,11 +437,11 @@ class TestE2EExplainability:
         # Extract key decisions
         decisions = {}
         for step in trace:
-            if 'resolve_semantic_object_complete' in step['step']:
+            if 'resolve_semantic_object' in step['step']:
                 decisions['semantic_object'] = step['data']
-            elif 'resolve_version_complete' in step['step']:
+            elif 'resolve_version' in step['step']:
                 decisions['version'] = step['data']
-            elif 'policy_check_complete' in step['step']:
+            elif 'policy_check' in step['step']:
                 decisions['policy'] = step['data']
 
         # Verify semantic object decision
@@ -498,5 +498,5 @@ class TestE2EExplainability:
 
         # Verify scenario match was logged
         # (This would be in the logs, but we check the trace here)
-        scenario_step = next((s for s in trace if 'resolve_version_complete' in s['step']), None)
+        scenario_step = next((s for s in trace if 'resolve_version' in s['step']), None)
         assert scenario_step is not None
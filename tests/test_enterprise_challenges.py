@@ -241,7 +241,7 @@ class TestPriorityConflictResolution:
 
         # Decision trace should explain priority selection
         trace = result['decision_trace']
-        version_step = next(s for s in trace if 'resolve_version_complete' in s['step'])
+        version_step = next(s for s in trace if 'resolve_version' in s['step'])
         assert 'priority' in version_step['data']['version_selection_reason'].lower() or \
                'FPY_v2_conflict_b' in result['version']
 
@@ -510,6 +510,6 @@ class TestPhysicalMappingPortability:
 
         # Decision trace should explain mapping selection
         trace = result['decision_trace']
-        mapping_step = next(s for s in trace if 'resolve_physical_mapping_complete' in s['step'])
+        mapping_step = next(s for s in trace if 'resolve_physical_mapping' in s['step'])
         assert 'priority' in mapping_step['data']['physical_mapping_reason'].lower() or \
                'selected' in mapping_step['data']['physical_mapping_reason'].lower()
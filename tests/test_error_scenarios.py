@@ -209,7 +209,9 @@ class TestErrorScenarios:
         # ============================================================
         # ARRANGE: Create mock state by removing all versions for FPY
         # ============================================================
-        conn = sqlite3.connect(test_db_path)
+        # test_db_path is a file: memory URI; uri=True keeps this working
+        # on SQLite builds that don't enable URI filenames by default
+        conn = sqlite3.connect(test_db_path, uri=True)
         cursor = conn.cursor()
         
         # Must delete in order due to foreign key constraints:
@@ -280,7 +280,7 @@ class TestGrossMarginCrossDepartment:
         
         # Decision trace should explain version selection
         trace = result['decision_trace']
-        version_step = next(s for s in trace if 'resolve_version_complete' in s['step'])
+        version_step = next(s for s in trace if 'resolve_version' in s['step'])
         assert 'finance' in version_step['data'].get('version_name', '').lower() or \
                'finance' in result['version'].lower()
     
@@ -450,5 +450,5 @@ class TestGrossMarginCrossDepartment:
         assert len(version_steps) > 0
         
         # Should explain the selection
-        version_step = next(s for s in trace if 'resolve_version_complete' in s['step'])
+        version_step = next(s for s in trace if 'resolve_version' in s['step'])
         assert 'version_selection_reason' in version_step['data']
@@ -40,7 +40,9 @@ class TestImpactAnalysis:
 
 class TestDependencyBuilder:
     def test_build_dependencies_from_expression(self, test_db_path):
-        conn = sqlite3.connect(test_db_path)
+        # test_db_path is a file: memory URI; uri=True keeps this working
+        # on SQLite builds that don't enable URI filenames by default
+        conn = sqlite3.connect(test_db_path, uri=True)
         cursor = conn.cursor()
 
         # Create a composite metric with explicit refs
@@ -275,20 +275,13 @@ class TestSemanticOrchestratorIntegration:
         step_names = [step['step'] for step in trace]
 
         # Should include these key steps
-        assert 'resolve_semantic_object_start' in step_names
-        assert 'resolve_semantic_object_complete' in step_names
-        assert 'resolve_version_start' in step_names
-        assert 'resolve_version_complete' in step_names
-        assert 'resolve_logic_start' in step_names
-        assert 'resolve_logic_complete' in step_names
-        assert 'resolve_physical_mapping_start' in step_names
-        assert 'resolve_physical_mapping_complete' in step_names
-        assert 'policy_check_start' in step_names
-        assert 'policy_check_complete' in step_names
-        assert 'render_sql_start' in step_names
-        assert 'render_sql_complete' in step_names
-        assert 'execution_start' in step_names
-        assert 'execution_complete' in step_names
+        assert 'resolve_semantic_object' in step_names
+        assert 'resolve_version' in step_names
+        assert 'resolve_logic' in step_names
+        assert 'resolve_physical_mapping' in step_names
+        assert 'policy_check' in step_names
+        assert 'render_sql' in step_names
+        assert 'execution' in step_names
 
     def test_sql_generation_correctness(self, test_db_path):
         """Test that generated SQL is correct."""
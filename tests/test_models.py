@@ -7,7 +7,8 @@ from datetime import datetime
 from semantic_layer.models import (
     SemanticObject, SemanticVersion, LogicalDefinition,
     PhysicalMapping, AccessPolicy, ExecutionAudit, ExecutionContext,
-    AmbiguityError, PolicyDeniedError, VersionNotFoundError, MappingNotFoundError
+    AmbiguityError, PolicyDeniedError, VersionNotFoundError, MappingNotFoundError,
+    versions_effective_at, request_clock, request_now
 )
 
 
@@ -53,6 +54,36 @@ class TestSemanticObject:
         assert obj.matches_alias('产量') is False
 
 
+class TestSemanticObjectIndex:
+    """Test SemanticObjectIndex term lookup."""
+
+    def test_resolve_by_name_and_alias(self):
+        """Test resolving objects by name and alias in one lookup."""
+        from semantic_layer.models import SemanticObjectIndex
+
+        fpy = SemanticObject(
+            id=1,
+            name='FPY',
+            description='First Pass Yield',
+            aliases=['直通率', '良率'],
+            domain='production'
+        )
+        output = SemanticObject(
+            id=2,
+            name='Output',
+            description='Production output',
+            aliases=['产量'],
+            domain='production'
+        )
+
+        index = SemanticObjectIndex([fpy, output])
+
+        assert index.resolve('fpy') is fpy
+        assert index.resolve('直通率') is fpy
+        assert index.resolve('产量') is output
+        assert index.resolve('unknown') is None
+
+
 class TestSemanticVersion:
     """Test SemanticVersion model."""
 
@@ -170,6 +201,56 @@ class TestSemanticVersion:
         assert version.matches_scenario({}) is False
         assert version.matches_scenario(None) is False
 
+    def test_matches_scenario_with_list_condition(self):
+        """Test scenario matching when condition values are unhashable."""
+        version = SemanticVersion(
+            id=1,
+            semantic_object_id=1,
+            version_name='FPY_v3',
+            effective_from=datetime(2024, 1, 1),
+            effective_to=None,
+            scenario_condition={'lines': ['A', 'B']},
+            is_active=True,
+            description='FPY for specific lines'
+        )
+
+        assert version.matches_scenario({'lines': ['A', 'B']}) is True
+        assert version.matches_scenario({'lines': ['A', 'B'], 'other': 1}) is True
+        assert version.matches_scenario({'lines': ['C']}) is False
+        assert version.matches_scenario({}) is False
+        assert version.matches_scenario(None) is False
+
+    def test_versions_effective_at(self):
+        """Test bulk effectiveness filtering over many versions."""
+        def make(id, effective_from, effective_to=None, is_active=True):
+            return SemanticVersion(
+                id=id,
+                semantic_object_id=1,
+                version_name=f'FPY_v{id}',
+                effective_from=effective_from,
+                effective_to=effective_to,
+                scenario_condition=None,
+                is_active=is_active,
+            )
+
+        current = make(1, datetime(2024, 1, 1))
+        expired = make(2, datetime(2024, 1, 1), effective_to=datetime(2024, 6, 1))
+        future = make(3, datetime(2999, 1, 1))
+        inactive = make(4, datetime(2024, 1, 1), is_active=False)
+
+        effective = versions_effective_at(
+            [current, expired, future, inactive],
+            datetime(2024, 9, 1)
+        )
+        assert effective == [current]
+
+        # Matches the per-version checks for every input
+        for version in (current, expired, future, inactive):
+            assert (version in effective) == version.is_effective(datetime(2024, 9, 1))
+
+        # Defaulting the timestamp uses the current clock
+        assert versions_effective_at([current, future]) == [current]
+
 
 class TestLogicalDefinition:
     """Test LogicalDefinition model."""
@@ -279,6 +360,18 @@ class TestExecutionContext:
         assert result['parameters'] == {'line': 'A'}
         assert 'timestamp' in result
 
+    def test_request_clock_pins_timestamp(self):
+        """Contexts created inside one request_clock scope share a timestamp."""
+        with request_clock():
+            first = ExecutionContext(user_id=1, role='operator', parameters={})
+            second = ExecutionContext(user_id=2, role='analyst', parameters={})
+            assert first.timestamp == second.timestamp
+            assert request_now() == first.timestamp
+
+        # Outside the scope each context takes its own reading again
+        outside = ExecutionContext(user_id=1, role='operator', parameters={})
+        assert outside.timestamp >= first.timestamp
+
 
 class TestExecutionAudit:
     """Test ExecutionAudit model."""
@@ -2,9 +2,15 @@
 Unit tests for PolicyEngine.
 """
 
+import json
+import sqlite3
+
 import pytest
 from semantic_layer.policy_engine import PolicyEngine
 from semantic_layer.models import PolicyDeniedError
+from semantic_layer.sqlite_stores import SQLitePolicyStore
+
+from tests.fixtures.db_fixtures import fetch_all, fetch_one
 
 
 class TestPolicyEngine:
@@ -21,9 +27,9 @@ class TestPolicyEngine:
             context=None
         )
 
-        assert decision['allow'] is True
-        assert 'Allowed' in decision['reason']
-        assert len(decision['policies']) >= 1
+        assert decision.allow is True
+        assert 'Allowed' in decision.reason
+        assert len(decision.policies) >= 1
 
     def test_check_access_denied(self, test_db_path):
         """Test access check for denied user."""
@@ -63,8 +69,8 @@ class TestPolicyEngine:
             context={'line': 'A'}
         )
 
-        assert decision['allow'] is True
-        assert len(decision['policies']) >= 1
+        assert decision.allow is True
+        assert len(decision.policies) >= 1
 
     def test_check_access_wildcard_role(self, test_db_path):
         """Test access check with wildcard role."""
@@ -79,7 +85,7 @@ class TestPolicyEngine:
             context=None
         )
 
-        assert decision['allow'] is True
+        assert decision.allow is True
 
     def test_matches_condition_no_condition(self, test_db_path):
         """Test policy condition matching when no condition."""
@@ -135,7 +141,7 @@ class TestPolicyEngine:
         decision = engine._evaluate_policies(policies, None)
 
         # Should allow
-        assert decision['allow'] is True
+        assert decision.allow is True
 
     def test_get_user_policies(self, test_db_path):
         """Test getting all policies for a user."""
@@ -197,7 +203,7 @@ class TestPolicyEngine:
             action='query',
             context=None
         )
-        assert decision['allow'] is True
+        assert decision.allow is True
 
         # Analyst can export (if such policy exists)
         # This depends on seed data
@@ -211,4 +217,67 @@ class TestPolicyEngine:
         # Otherwise will be empty
         if policies:
             decision = engine._evaluate_policies(policies, None)
-            assert 'allow' in decision
+            assert decision.allow in (True, False)
+
+
+class TestCreatePoliciesBulk:
+    """Test SQLitePolicyStore.create_policies_bulk."""
+
+    def test_bulk_insert_count_and_rows(self, test_db_path):
+        """All entries land with their effect and priority, count returned."""
+        store = SQLitePolicyStore(test_db_path)
+
+        created = store.create_policies_bulk([
+            {'semantic_object_id': 1, 'role': 'auditor', 'action': 'query',
+             'effect': 'allow', 'priority': 10},
+            {'semantic_object_id': 1, 'role': 'auditor', 'action': 'export',
+             'effect': 'deny', 'priority': 20,
+             'condition': {'shift': 'night'}},
+            {'semantic_object_id': 2, 'role': 'auditor', 'action': 'query',
+             'effect': 'allow'},
+        ])
+        assert created == 3
+
+        rows = fetch_all(
+            test_db_path,
+            """
+            SELECT semantic_object_id, action, effect, priority, condition
+            FROM access_policy WHERE role = 'auditor'
+            ORDER BY priority
+            """
+        )
+        assert [(r[0], r[1], r[2], r[3]) for r in rows] == [
+            (2, 'query', 'allow', 0),
+            (1, 'query', 'allow', 10),
+            (1, 'export', 'deny', 20),
+        ]
+        # Condition serialized as JSON, absent condition stored as NULL
+        assert rows[0][4] is None
+        assert json.loads(rows[2][4]) == {'shift': 'night'}
+
+    def test_malformed_entry_rolls_back_batch(self, test_db_path):
+        """All-or-nothing: one bad entry leaves no rows from the batch."""
+        store = SQLitePolicyStore(test_db_path)
+
+        # Missing required key: fails while building rows, before any SQL
+        with pytest.raises(KeyError):
+            store.create_policies_bulk([
+                {'semantic_object_id': 1, 'role': 'auditor', 'action': 'query',
+                 'effect': 'allow'},
+                {'semantic_object_id': 1, 'role': 'auditor', 'action': 'query'},
+            ])
+
+        # NULL effect: violates NOT NULL mid-batch, insert rolls back
+        with pytest.raises(sqlite3.IntegrityError):
+            store.create_policies_bulk([
+                {'semantic_object_id': 1, 'role': 'auditor', 'action': 'query',
+                 'effect': 'allow'},
+                {'semantic_object_id': 1, 'role': 'auditor', 'action': 'query',
+                 'effect': None},
+            ])
+
+        count = fetch_one(
+            test_db_path,
+            "SELECT COUNT(*) FROM access_policy WHERE role = 'auditor'"
+        )
+        assert count[0] == 0